@@ -0,0 +1,92 @@
+import warnings
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # Fall back to the standard library array module
+    np = None
+
+
+def parse_columns(file_path):
+    """
+    Parse the input file straight into two compact int64 columns.
+    Uses NumPy when it is available, otherwise array('q').
+    :param file_path: Path to the input file.
+    :return: Two int64 arrays holding the left and right columns.
+    """
+    try:
+        if np is not None:
+            # An empty file is not an error here; it loads with a single degenerate column
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", ".*input contained no data", UserWarning)
+                pairs = np.loadtxt(file_path, dtype=np.int64, ndmin=2)
+
+            if pairs.size == 0:
+                return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+            if pairs.shape[1] != 2:
+                raise ValueError(f"Expected 2 columns, found {pairs.shape[1]}")
+
+            return pairs[:, 0].copy(), pairs[:, 1].copy()
+
+        column1, column2 = array("q"), array("q")
+
+        with open(file_path, "r") as f:
+            for line in f:
+                nums = line.split()
+
+                if len(nums) != 2:
+                    raise ValueError(f"Malformed line: {line}")
+
+                column1.append(int(nums[0]))
+                column2.append(int(nums[1]))
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+
+    except ValueError as e:
+        raise ValueError(f"Error processing input file: {e}")
+
+    return column1, column2
+
+
+def calc_distances_array(column1, column2):
+    """
+    Calculate the total distance between two int64 columns.
+    The columns are sorted in place and reduced in a single pass.
+    :param column1: Left column as a NumPy int64 array or array('q').
+    :param column2: Right column as a NumPy int64 array or array('q').
+    :return: Total distance between the two columns.
+    """
+    if np is not None and isinstance(column1, np.ndarray):
+        column1.sort()
+        column2.sort()
+
+        return int(np.abs(column1 - column2).sum())
+
+    # array('q') has no in-place sort, so refill each buffer from its sorted values
+    column1[:] = array("q", sorted(column1))
+    column2[:] = array("q", sorted(column2))
+
+    return sum(abs(i - j) for i, j in zip(column1, column2))
+
+
+def process_input_array(file_path):
+    """
+    Parse the input file and calculate the total distance using the array engine.
+    :param file_path: Path to the input file.
+    :return: Total distance between the two lists.
+    """
+    column1, column2 = parse_columns(file_path)
+
+    return calc_distances_array(column1, column2)
+
+
+if __name__ == "__main__":
+    input_file = "inputs.txt"  # Default file path
+
+    try:
+        total_distance = process_input_array(input_file)
+        print(f"Total Distance: {total_distance}")
+    except Exception as e:
+        print(f"Error: {e}")
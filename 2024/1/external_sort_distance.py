@@ -0,0 +1,167 @@
+import heapq
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # Bytes of run buffers held in memory at once
+DEFAULT_FAN_IN = 64  # Maximum number of run files open at once while merging
+ITEM_SIZE = array("q").itemsize
+BOXED_ITEM_SIZE = struct.calcsize("P") + sys.getsizeof(2 ** 62)  # List slot plus int object per sorted() value
+
+
+def write_run(values, directory, block_size):
+    """
+    Write sorted values to disk as a run of raw int64s, one block at a time.
+    :param values: Iterable of integers in sorted order.
+    :param directory: Directory in which to create the run file.
+    :param block_size: Number of values to buffer per write.
+    :return: Path to the run file.
+    """
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+
+    with os.fdopen(fd, "wb") as f:
+        block = array("q")
+
+        for value in values:
+            block.append(value)
+
+            if len(block) >= block_size:
+                block.tofile(f)
+                block = array("q")
+
+        block.tofile(f)
+
+    return path
+
+
+def read_run(path, block_size):
+    """
+    Stream the values of a sorted run back from disk, one block at a time.
+    :param path: Path to the run file.
+    :param block_size: Number of values to read per block.
+    :return: A generator of integers in sorted order.
+    """
+    with open(path, "rb") as f:
+        while True:
+            block = array("q")
+            block.frombytes(f.read(block_size * ITEM_SIZE))
+
+            if not block:
+                return
+
+            yield from block
+
+
+def split_into_runs(file_path, run_length, directory):
+    """
+    Split both columns of the input file into sorted on-disk runs.
+    :param file_path: Path to the input file.
+    :param run_length: Maximum number of values per run.
+    :param directory: Directory in which to create the run files.
+    :return: Two lists of run file paths, one per column.
+    """
+    runs1, runs2 = [], []
+    buffer1, buffer2 = array("q"), array("q")
+    block_size = max(1, run_length // 8)  # Keep the write buffer small next to the sorted list
+
+    try:
+        with open(file_path, "r") as f:
+            for line in f:
+                nums = line.strip().split()
+
+                if len(nums) != 2:
+                    raise ValueError(f"Malformed line: {line}")
+
+                buffer1.append(int(nums[0]))
+                buffer2.append(int(nums[1]))
+
+                if len(buffer1) >= run_length:
+                    runs1.append(write_run(sorted(buffer1), directory, block_size))
+                    runs2.append(write_run(sorted(buffer2), directory, block_size))
+                    buffer1, buffer2 = array("q"), array("q")
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+
+    except ValueError as e:
+        raise ValueError(f"Error processing input file: {e}")
+
+    if buffer1:
+        runs1.append(write_run(sorted(buffer1), directory, block_size))
+        runs2.append(write_run(sorted(buffer2), directory, block_size))
+
+    return runs1, runs2
+
+
+def reduce_runs(runs, max_runs, block_size, directory):
+    """
+    Merge runs in passes of at most max_runs files until no more than max_runs remain.
+    Merged runs are deleted as soon as they have been consumed.
+    :param runs: List of run file paths.
+    :param max_runs: Maximum number of runs merged (and left) at once; at least 2.
+    :param block_size: Number of values to buffer per read and write.
+    :param directory: Directory in which to create the merged run files.
+    :return: List of at most max_runs run file paths.
+    :raises ValueError: If max_runs is below 2, since merging single runs never shrinks the list.
+    """
+    if max_runs < 2:
+        raise ValueError(f"Cannot merge runs {max_runs} at a time")
+
+    while len(runs) > max_runs:
+        merged = []
+
+        for i in range(0, len(runs), max_runs):
+            group = runs[i:i + max_runs]
+            merged.append(write_run(heapq.merge(*(read_run(path, block_size) for path in group)), directory, block_size))
+
+            for path in group:
+                os.remove(path)
+
+        runs = merged
+
+    return runs
+
+
+def calc_distances_external(file_path, memory_budget=DEFAULT_MEMORY_BUDGET, fan_in=DEFAULT_FAN_IN):
+    """
+    Calculate the total distance between the two columns of an input file
+    that may not fit in memory, using an external merge sort.
+    :param file_path: Path to the input file.
+    :param memory_budget: Approximate number of bytes of values to hold in memory.
+    :param fan_in: Maximum number of run files open at once while merging; at least 4.
+    :return: Total distance between the two lists.
+    :raises ValueError: If fan_in is below 4.
+    """
+    if fan_in < 4:
+        raise ValueError(f"fan_in must be at least 4 to merge both columns, got {fan_in}")
+
+    # Both typed column buffers are held while sorted() boxes one of them
+    run_length = max(1, memory_budget // (2 * ITEM_SIZE + BOXED_ITEM_SIZE))
+    # The final merge reads both columns at once, so each gets half the fan-in
+    max_runs = fan_in // 2
+
+    with tempfile.TemporaryDirectory() as directory:
+        runs1, runs2 = split_into_runs(file_path, run_length, directory)
+
+        # Share the budget between the read buffers of every open run
+        block_size = max(1, memory_budget // (ITEM_SIZE * 2 * max_runs))
+
+        runs1 = reduce_runs(runs1, max_runs, block_size, directory)
+        runs2 = reduce_runs(runs2, max_runs, block_size, directory)
+
+        merged1 = heapq.merge(*(read_run(path, block_size) for path in runs1))
+        merged2 = heapq.merge(*(read_run(path, block_size) for path in runs2))
+
+        return sum(abs(i - j) for i, j in zip(merged1, merged2))
+
+
+if __name__ == "__main__":
+    input_file = "inputs.txt"  # Default file path
+
+    try:
+        total_distance = calc_distances_external(input_file)
+        print(f"Total Distance: {total_distance}")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,74 @@
+from similarity_scores import parse_input
+
+
+def merge_join_similarity(sorted_list1, sorted_list2):
+    """
+    Calculate the similarity score from two sorted lists with a merge-join.
+    Each run of equal values in list1 is multiplied by the length of the
+    matching run in list2, so no hash table is needed.
+    :param sorted_list1: Left list in ascending order.
+    :param sorted_list2: Right list in ascending order.
+    :return: Total similarity score.
+    """
+    total = 0
+    i, n1 = 0, len(sorted_list1)
+    j, n2 = 0, len(sorted_list2)
+
+    while i < n1:
+        value = sorted_list1[i]
+
+        # Length of the run of this value in list1
+        start1 = i
+        while i < n1 and sorted_list1[i] == value:
+            i += 1
+
+        # Skip smaller values in list2, then measure the matching run
+        while j < n2 and sorted_list2[j] < value:
+            j += 1
+        start2 = j
+        while j < n2 and sorted_list2[j] == value:
+            j += 1
+
+        total += value * (i - start1) * (j - start2)
+
+    return total
+
+
+def calc_distance_and_similarity(list1, list2):
+    """
+    Calculate the total distance and similarity score from a single sort of each list.
+    :param list1: Left list of integers.
+    :param list2: Right list of integers.
+    :return: A tuple (total_distance, total_similarity).
+    """
+    sorted_list1 = sorted(list1)
+    sorted_list2 = sorted(list2)
+
+    total_distance = sum(abs(i - j) for i, j in zip(sorted_list1, sorted_list2))
+    total_similarity = merge_join_similarity(sorted_list1, sorted_list2)
+
+    return total_distance, total_similarity
+
+
+def process_input(file_path):
+    """
+    Parse the input file once and calculate both the distance and the similarity score.
+    :param file_path: Path to the input file.
+    :return: A tuple (total_distance, total_similarity).
+    """
+    list1, list2 = parse_input(file_path)
+
+    return calc_distance_and_similarity(list1, list2)
+
+
+if __name__ == "__main__":
+    input_file = "inputs.txt"  # Default file path
+
+    try:
+        total_distance, total_similarity = process_input(input_file)
+
+        print(f"Total Distance: {total_distance}")
+        print(f"Total Similarity Score: {total_similarity}")
+
+    except Exception as e:
+        print(f"Error: {e}")
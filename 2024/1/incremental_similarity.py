@@ -0,0 +1,78 @@
+from collections import defaultdict
+
+
+class SimilarityAccumulator:
+    """
+    Running similarity score over a stream of location pairs.
+    The score is the sum over every value v of v * count1[v] * count2[v],
+    so each new pair only changes the terms for its own two values.
+    """
+
+    def __init__(self):
+        self.count1 = defaultdict(int)
+        self.count2 = defaultdict(int)
+        self.score = 0
+
+    def add_pair(self, left, right):
+        """
+        Add one location pair and update the running score in O(1).
+        :param left: Value from the left list.
+        :param right: Value from the right list.
+        :return: The updated similarity score.
+        """
+        # The new left value pairs with every right value already seen
+        self.score += left * self.count2[left]
+        self.count1[left] += 1
+
+        # The new right value pairs with every left value seen so far, including this one
+        self.score += right * self.count1[right]
+        self.count2[right] += 1
+
+        return self.score
+
+    def add_pairs(self, pairs):
+        """
+        Add a batch of location pairs.
+        :param pairs: Iterable of (left, right) tuples.
+        :return: The updated similarity score.
+        """
+        for left, right in pairs:
+            self.add_pair(left, right)
+
+        return self.score
+
+
+def stream_pairs(file_path):
+    """
+    Lazily read location pairs from the input file.
+    :param file_path: Path to the input file.
+    :return: A generator of (left, right) tuples.
+    """
+    try:
+        with open(file_path, "r") as f:
+            for line in f:
+                nums = line.strip().split()
+
+                if len(nums) != 2:
+                    raise ValueError(f"Malformed line: {line}")
+
+                yield int(nums[0]), int(nums[1])
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+
+    except ValueError as e:
+        raise ValueError(f"Error processing input file: {e}")
+
+
+if __name__ == "__main__":
+    input_file = "inputs.txt"  # Default file path
+
+    try:
+        accumulator = SimilarityAccumulator()
+        total_similarity = accumulator.add_pairs(stream_pairs(input_file))
+
+        print(f"Total Similarity Score: {total_similarity}")
+
+    except Exception as e:
+        print(f"Error: {e}")
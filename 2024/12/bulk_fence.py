@@ -1,71 +1,80 @@
+import os
+import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from grid import Grid
+
+
 def parse_input(file_path):
     """
     Parse the input file to create a 2D grid representing the garden plots.
     :param file_path: Path to the input file.
-    :return: A 2D list of characters representing the garden plots.
+    :return: A Grid representing the garden plots.
     """
     try:
-        with open(file_path, "r") as file:
-            return [list(line.strip()) for line in file.readlines()]
+        return Grid.from_file(file_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Input file '{file_path}' not found.")
     except Exception as e:
         raise RuntimeError(f"An error occurred while reading the input file: {e}")
 
-def calculate_region_area_and_sides(grid, x, y, plant_type, visited):
+def calculate_region_area_and_sides(grid, start, plant_type, visited):
     """
     Perform flood-fill to calculate the area and sides of a region.
-    :param grid: The garden grid.
-    :param x: The starting x-coordinate.
-    :param y: The starting y-coordinate.
-    :param plant_type: The type of plant for the region.
-    :param visited: A set to track visited cells.
+    A region has as many sides as corners, so each cell adds its convex corners
+    (both neighbors around a corner outside the region) and concave corners (both
+    neighbors inside but the diagonal cell between them outside).
+    :param grid: The garden Grid.
+    :param start: Flat index of the starting cell.
+    :param plant_type: The type of plant for the region, as a byte value.
+    :param visited: A set to track visited flat indices.
     :return: A tuple (area, sides) of the region.
     """
-    rows, cols = len(grid), len(grid[0])
-    queue = deque([(x, y)])
-    visited.add((x, y))
+    cells = grid.cells
+    steps = grid.directions
+    queue = deque([start])
+    visited.add(start)
     area = 0
     sides = 0
 
-    # Directions for moving in the grid
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
     while queue:
-        cx, cy = queue.popleft()
+        current = queue.popleft()
         area += 1
 
-        for dx, dy in directions:
-            nx, ny = cx + dx, cy + dy
-            if 0 <= nx < rows and 0 <= ny < cols:
-                if grid[nx][ny] != plant_type:
-                    sides += 2  # Fence separating regions; count twice
-                elif (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append((nx, ny))
-            else:
-                sides += 1  # Fence at the grid boundary contributes one side
+        for d in range(4):
+            # Each pair of clockwise-adjacent directions meets at one corner of the cell
+            step, next_step = steps[d], steps[(d + 1) % 4]
+            same = cells[current + step] == plant_type
+            next_same = cells[current + next_step] == plant_type
+
+            if not same and not next_same:
+                sides += 1  # Convex corner
+            elif same and next_same and cells[current + step + next_step] != plant_type:
+                sides += 1  # Concave corner
+
+            neighbor = current + step
+            if same and neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
 
     return area, sides
 
 def calculate_total_fence_price(grid):
     """
     Calculate the total price of fencing all regions in the garden plot.
-    :param grid: The garden grid.
+    :param grid: The garden Grid.
     :return: The total price of fencing.
     """
     visited = set()
     total_price = 0
 
-    rows, cols = len(grid), len(grid[0])
-    for x in range(rows):
-        for y in range(cols):
-            if (x, y) not in visited:  # New region
-                area, sides = calculate_region_area_and_sides(grid, x, y, grid[x][y], visited)
-                price = area * sides
-                total_price += price
+    for i in grid.indices():
+        if i not in visited:  # New region
+            area, sides = calculate_region_area_and_sides(grid, i, grid.cells[i], visited)
+            price = area * sides
+            total_price += price
 
     return total_price
 
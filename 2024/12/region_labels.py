@@ -0,0 +1,87 @@
+from array import array
+
+from single_fence import parse_input
+
+
+def find(parent, i):
+    """
+    Find the root label of a cell, halving the path as it goes.
+    :param parent: Union-find parent array.
+    :param i: Flat index of the cell.
+    :return: Flat index of the root cell of its region.
+    """
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def label_regions(grid):
+    """
+    Label the regions of the garden in one raster-order pass with an array-based
+    union-find, accumulating area and perimeter per label as cells are merged.
+    A cell adds 4 to the perimeter, and each matching neighbor to its left or
+    above removes the 2 fence sides that the two cells share.
+    :param grid: The garden Grid.
+    :return: A tuple (parent, area, perimeter) of arrays indexed by flat cell index;
+             area and perimeter are meaningful at root cells.
+    """
+    cells = grid.cells
+    size = len(cells)
+    parent = array('q', range(size))
+    area = array('q', bytes(8 * size))
+    perimeter = array('q', bytes(8 * size))
+    up = grid.stride
+
+    for i in grid.indices():
+        plant = cells[i]
+        root = i
+        area[i] = 1
+        perimeter[i] = 4
+
+        # The sentinel border never matches a plant, so no bounds checks are needed
+        for neighbor in (i - 1, i - up):
+            if cells[neighbor] != plant:
+                continue
+
+            other = find(parent, neighbor)
+            perimeter[root] -= 2
+            if other == root:
+                continue
+
+            # Union by area: hang the smaller region under the larger one
+            if area[other] < area[root]:
+                root, other = other, root
+            parent[root] = other
+            area[other] += area[root]
+            perimeter[other] += perimeter[root]
+            root = other
+
+    return parent, area, perimeter
+
+
+def calculate_total_fence_price(grid):
+    """
+    Calculate the total price of fencing all regions in the garden plot.
+    :param grid: The garden Grid.
+    :return: The total price of fencing.
+    """
+    parent, area, perimeter = label_regions(grid)
+
+    return sum(area[i] * perimeter[i] for i in grid.indices() if parent[i] == i)
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+
+    try:
+        # Parse the garden grid
+        garden_grid = parse_input(input_file)
+
+        # Calculate the total fence price
+        total_price = calculate_total_fence_price(garden_grid)
+
+        print(f"Total price of fencing all regions: {total_price}")
+
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,97 @@
+import numpy as np
+
+from bulk_fence import parse_input
+from region_labels import label_regions
+
+BACKGROUND = -1  # Label of the padding around the garden
+
+
+def label_image(grid):
+    """
+    Build a padded 2D image of region labels for the garden.
+    Labels come from the union-find pass, with roots resolved for every cell at
+    once by pointer jumping over the whole parent array.
+    :param grid: The garden Grid.
+    :return: An int64 array of shape (rows + 2, cols + 2), BACKGROUND on the border.
+    """
+    image = np.full((grid.rows + 2, grid.cols + 2), BACKGROUND, dtype=np.int64)
+    if grid.rows == 0:
+        return image
+
+    parent, _, _ = label_regions(grid)
+    roots = np.frombuffer(parent, dtype=np.int64)
+
+    while True:
+        jumped = roots[roots]
+        if np.array_equal(jumped, roots):
+            break
+        roots = jumped
+
+    # Flat index origin + r * stride + c sits at row r + 1, column c of this reshape
+    planes = roots[1:].reshape(grid.rows + 2, grid.stride)
+    image[1:-1, 1:-1] = planes[1:-1, :grid.cols]
+    return image
+
+
+def count_area_and_sides(image):
+    """
+    Count the area and number of sides of every region in a padded label image.
+    A region has as many sides as corners. Every 2x2 window is a grid vertex; a
+    cell of the window is a convex corner of its region when both of its window
+    neighbors belong to another region, and a concave corner when both belong to
+    its region but the diagonal cell does not.
+    :param image: Padded label image as returned by label_image.
+    :return: A dictionary mapping each region label to (area, sides).
+    """
+    top_left, top_right = image[:-1, :-1], image[:-1, 1:]
+    bottom_left, bottom_right = image[1:, :-1], image[1:, 1:]
+
+    # (cell, horizontal neighbor, vertical neighbor, diagonal neighbor) for each window position
+    windows = [
+        (top_left, top_right, bottom_left, bottom_right),
+        (top_right, top_left, bottom_right, bottom_left),
+        (bottom_left, bottom_right, top_left, top_right),
+        (bottom_right, bottom_left, top_right, top_left),
+    ]
+
+    corner_labels = []
+    for cell, horizontal, vertical, diagonal in windows:
+        same_horizontal = cell == horizontal
+        same_vertical = cell == vertical
+        convex = ~same_horizontal & ~same_vertical
+        concave = same_horizontal & same_vertical & (cell != diagonal)
+        corner_labels.append(cell[(convex | concave) & (cell != BACKGROUND)])
+
+    labels, area = np.unique(image[image != BACKGROUND], return_counts=True)
+    sides = np.zeros(len(labels), dtype=np.int64)
+    corners = np.concatenate(corner_labels)
+    np.add.at(sides, np.searchsorted(labels, corners), 1)
+
+    return {int(label): (int(a), int(s)) for label, a, s in zip(labels, area, sides)}
+
+
+def calculate_total_fence_price(grid):
+    """
+    Calculate the total bulk-discount price (area times number of sides) of all regions.
+    :param grid: The garden Grid.
+    :return: The total price of fencing.
+    """
+    regions = count_area_and_sides(label_image(grid))
+
+    return sum(area * sides for area, sides in regions.values())
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+
+    try:
+        # Parse the garden grid
+        garden_grid = parse_input(input_file)
+
+        # Calculate the total fence price
+        total_price = calculate_total_fence_price(garden_grid)
+
+        print(f"Total price of fencing all regions: {total_price}")
+
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,140 @@
+from itertools import chain
+
+import numpy as np
+
+
+def parse_input_csr(file_path):
+    """
+    Parse the input file into a flat array of levels plus report offsets (CSR layout).
+    Report k spans values[offsets[k]:offsets[k + 1]].
+    :param file_path: Path to the input file.
+    :return: A tuple (values, offsets) of int64 arrays.
+    """
+    try:
+        with open(file_path, "r") as f:
+            rows = [line.split() for line in f]
+
+        values = np.array(list(chain.from_iterable(rows)), dtype=np.int64)
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+
+    except ValueError as e:
+        raise ValueError(f"Error processing input file: {e}")
+
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=offsets[1:])
+
+    return values, offsets
+
+
+def levels_to_csr(levels):
+    """
+    Convert a list of reports into the CSR layout.
+    :param levels: A list of lists, where each inner list represents a report.
+    :return: A tuple (values, offsets) of int64 arrays.
+    """
+    values = np.fromiter(chain.from_iterable(levels), dtype=np.int64)
+    offsets = np.zeros(len(levels) + 1, dtype=np.int64)
+    np.cumsum([len(report) for report in levels], out=offsets[1:])
+
+    return values, offsets
+
+
+def good_steps(diffs, sign):
+    """
+    Flag adjacent differences that are safe in one direction.
+    :param diffs: Array of adjacent level differences.
+    :param sign: 1 for increasing, -1 for decreasing.
+    :return: Boolean array, True where 1 <= sign * diff <= 3.
+    """
+    steps = sign * diffs
+    return (steps >= 1) & (steps <= 3)
+
+
+def prefix_counts(flags):
+    """
+    Build an exclusive prefix sum so that counts[b] - counts[a] is the
+    number of set flags in flags[a:b].
+    :param flags: Boolean array.
+    :return: int64 array one element longer than flags.
+    """
+    counts = np.zeros(len(flags) + 1, dtype=np.int64)
+    np.cumsum(flags, out=counts[1:])
+    return counts
+
+
+def safety_masks(values, offsets):
+    """
+    Evaluate every report at once under both the plain and the dampened rules.
+    :param values: Flat int64 array of levels.
+    :param offsets: int64 array of report boundaries.
+    :return: A tuple (safe, safe_with_dampener) of boolean arrays, one entry per report.
+    """
+    starts, ends = offsets[:-1], offsets[1:]
+    lengths = ends - starts
+
+    # Diff g is values[g + 1] - values[g]; diffs of report k lie in [start, end - 1).
+    # A trailing zero keeps the array as long as values, so report bounds always index it.
+    diffs = np.diff(values, append=values[-1:])
+    diff_ends = np.maximum(ends - 1, starts)
+
+    # Per-level view: which report each level belongs to and where it sits
+    level_starts = np.repeat(starts, lengths)
+    level_diff_ends = np.repeat(diff_ends, lengths)
+    level_index = np.arange(len(values), dtype=np.int64)
+    interior = (level_index > level_starts) & (level_index < level_diff_ends)
+
+    # Difference across a removed interior level: values[g + 1] - values[g - 1]
+    bridge = np.zeros(len(values), dtype=np.int64)
+    if len(values) >= 3:
+        bridge[1:-1] = values[2:] - values[:-2]
+
+    safe = np.zeros(len(lengths), dtype=bool)
+    safe_with_dampener = np.zeros(len(lengths), dtype=bool)
+
+    for sign in (1, -1):
+        bad = prefix_counts(~good_steps(diffs, sign))
+
+        # Plain rule: no bad diff anywhere in the report
+        safe |= bad[diff_ends] - bad[starts] == 0
+
+        # Dampened rule: removing level g leaves diffs [start, g - 1) and [g + 1, end - 1)
+        # plus, for interior levels, the bridging diff across g
+        before = bad[np.maximum(level_index - 1, level_starts)] - bad[level_starts]
+        after = bad[level_diff_ends] - bad[np.minimum(level_index + 1, level_diff_ends)]
+        bridge_ok = ~interior | good_steps(bridge, sign)
+
+        removable = prefix_counts((before == 0) & (after == 0) & bridge_ok)
+        safe_with_dampener |= removable[ends] - removable[starts] > 0
+
+    safe_with_dampener |= safe
+
+    return safe, safe_with_dampener
+
+
+def check_safety_batch(values, offsets):
+    """
+    Count the safe reports under the plain and the dampened rules.
+    :param values: Flat int64 array of levels.
+    :param offsets: int64 array of report boundaries.
+    :return: A tuple (safe_count, safe_with_dampener_count).
+    """
+    safe, safe_with_dampener = safety_masks(values, offsets)
+
+    return int(safe.sum()), int(safe_with_dampener.sum())
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+
+    try:
+        values, offsets = parse_input_csr(input_file)
+
+        total_safe, total_safe_dampened = check_safety_batch(values, offsets)
+
+        print(f"Safe reports: {total_safe}")
+        print(f"Safe reports with Problem Dampener: {total_safe_dampened}")
+
+    except Exception as e:
+        print(f"Error: {e}")
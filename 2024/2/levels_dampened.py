@@ -28,6 +28,55 @@ def can_be_safe_with_removal(report):
     return False
 
 
+def is_safe_skipping(report, skip, sign):
+    """
+    Check if a report is safe in one direction while ignoring a single level.
+    :param report: A list of integers representing levels.
+    :param skip: Index of the level to ignore.
+    :param sign: 1 for an increasing report, -1 for a decreasing one.
+    :return: True if the remaining levels are safe; otherwise False.
+    """
+    previous = None
+
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+
+        if previous is not None and not 1 <= sign * (level - previous) <= 3:
+            return False
+
+        previous = level
+
+    return True
+
+
+def can_be_safe_with_removal_linear(report):
+    """
+    Check if a single report can be made safe by removing one level, in linear time.
+    Any removal that fixes a report must drop one of the two levels of its first
+    bad adjacent pair, so only those two candidates are tested per direction.
+    :param report: A list of integers representing levels.
+    :return: True if the report can be made safe; otherwise False.
+    """
+    if not report:
+        return False
+
+    for sign in (1, -1):
+        # Find the first adjacent pair that breaks this direction
+        first_bad = next(
+            (i for i in range(len(report) - 1) if not 1 <= sign * (report[i + 1] - report[i]) <= 3),
+            None
+        )
+
+        if first_bad is None:
+            return True
+
+        if is_safe_skipping(report, first_bad, sign) or is_safe_skipping(report, first_bad + 1, sign):
+            return True
+
+    return False
+
+
 def check_safety_with_dampener(levels):
     """
     Check how many reports are safe, considering the Problem Dampener.
@@ -37,7 +86,7 @@ def check_safety_with_dampener(levels):
     count = 0
 
     for report in levels:
-        if is_safe_report(report) or can_be_safe_with_removal(report):
+        if is_safe_report(report) or can_be_safe_with_removal_linear(report):
             count += 1
 
     return count
@@ -0,0 +1,72 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from chunks import chunk_boundaries
+from levels_dampened import can_be_safe_with_removal_linear, is_safe_report
+
+
+def count_chunk(file_path, start, end):
+    """
+    Parse and classify the reports within one byte range of the input file.
+    :param file_path: Path to the input file.
+    :param start: Byte offset of the first line in the chunk.
+    :param end: Byte offset just past the last line in the chunk.
+    :return: A tuple (safe_count, safe_with_dampener_count).
+    """
+    safe = 0
+    safe_with_dampener = 0
+
+    with open(file_path, "rb") as f:
+        f.seek(start)
+
+        while f.tell() < end:
+            report = [int(i) for i in f.readline().split()]
+
+            if is_safe_report(report):
+                safe += 1
+                safe_with_dampener += 1
+            elif can_be_safe_with_removal_linear(report):
+                safe_with_dampener += 1
+
+    return safe, safe_with_dampener
+
+
+def check_safety_parallel(file_path, workers=None):
+    """
+    Count the safe reports in a file using a process pool over line-aligned chunks.
+    The parent process only sums the per-chunk counts.
+    :param file_path: Path to the input file.
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :return: A tuple (safe_count, safe_with_dampener_count).
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = chunk_boundaries(file_path, workers)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(count_chunk, file_path, start, end) for start, end in chunks]
+            counts = [future.result() for future in futures]
+
+    except ValueError as e:
+        raise ValueError(f"Error processing input file: {e}")
+
+    return sum(safe for safe, _ in counts), sum(dampened for _, dampened in counts)
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+
+    try:
+        total_safe, total_safe_dampened = check_safety_parallel(input_file)
+
+        print(f"Safe reports: {total_safe}")
+        print(f"Safe reports with Problem Dampener: {total_safe_dampened}")
+
+    except Exception as e:
+        print(f"Error: {e}")
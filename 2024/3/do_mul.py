@@ -1,15 +1,19 @@
+import mmap
 import re
 
 
-def parse_and_compute_with_conditions(memory):
+def parse_and_compute_with_conditions(memory, trace=None):
     """
     Parse the corrupted memory and compute the sum of valid mul(X,Y) instructions,
     considering the effects of do() and don't() instructions.
-    :param memory: String containing the corrupted memory.
+    :param memory: String or bytes-like buffer (e.g. a memory map) containing the corrupted memory.
+    :param trace: Optional callable receiving a message for every processed instruction.
     :return: Total sum of results from valid and enabled mul(X,Y) instructions.
     """
     # Regular expression to match mul(X,Y), do(), and don't() instructions
     pattern = r"(mul\((\d+),(\d+)\)|do\(\)|don't\(\))"
+    if not isinstance(memory, str):
+        pattern = pattern.encode()
 
     # Find all instructions in the memory
     matches = re.finditer(pattern, memory)
@@ -20,31 +24,44 @@ def parse_and_compute_with_conditions(memory):
 
     for match in matches:
         instruction = match.group(0)
+        if isinstance(instruction, bytes):
+            instruction = instruction.decode()  # Only the matched span is decoded
 
         if instruction.startswith("mul(") and mul_enabled:
             # Extract numbers from mul(X,Y)
             x, y = int(match.group(2)), int(match.group(3))
             total += x * y
-            print(f"Processing {instruction}: Enabled -> {x} * {y} = {x * y}")
+            if trace:
+                trace(f"Processing {instruction}: Enabled -> {x} * {y} = {x * y}")
         elif instruction == "do()":
             mul_enabled = True
-            print(f"Processing {instruction}: Enabling mul instructions")
+            if trace:
+                trace(f"Processing {instruction}: Enabling mul instructions")
         elif instruction == "don't()":
             mul_enabled = False
-            print(f"Processing {instruction}: Disabling mul instructions")
+            if trace:
+                trace(f"Processing {instruction}: Disabling mul instructions")
         else:
-            print(f"Ignored {instruction}")
+            if trace:
+                trace(f"Ignored {instruction}")
 
     return total
 
 
-def read_input(file_path):
+def read_input(file_path, use_mmap=False):
     """
     Read the contents of the input file.
     :param file_path: Path to the input file.
-    :return: String containing the file content.
+    :param use_mmap: Memory-map the file instead of decoding it into a string.
+    :return: String containing the file content, or a read-only memory map when use_mmap is set.
     """
     try:
+        if use_mmap:
+            with open(file_path, "rb") as file:
+                if not file.seek(0, 2):
+                    return b""  # Empty files cannot be mapped
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
         with open(file_path, "r") as file:
             return file.read()
     except FileNotFoundError:
@@ -1,14 +1,17 @@
+import mmap
 import re
 
 
 def parse_and_compute(memory):
     """
     Parse the corrupted memory and compute the sum of all valid mul(X,Y) instructions.
-    :param memory: String containing the corrupted memory.
+    :param memory: String or bytes-like buffer (e.g. a memory map) containing the corrupted memory.
     :return: Total sum of results from valid mul(X,Y) instructions.
     """
     # Regular expression to match valid mul(X,Y) instructions
     pattern = r"mul\((\d+),(\d+)\)"
+    if not isinstance(memory, str):
+        pattern = pattern.encode()
 
     # Find all matches in the memory
     matches = re.findall(pattern, memory)
@@ -19,13 +22,20 @@ def parse_and_compute(memory):
     return total
 
 
-def read_input(file_path):
+def read_input(file_path, use_mmap=False):
     """
     Read the contents of the input file.
     :param file_path: Path to the input file.
-    :return: String containing the file content.
+    :param use_mmap: Memory-map the file instead of decoding it into a string.
+    :return: String containing the file content, or a read-only memory map when use_mmap is set.
     """
     try:
+        if use_mmap:
+            with open(file_path, "rb") as file:
+                if not file.seek(0, 2):
+                    return b""  # Empty files cannot be mapped
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
         with open(file_path, "r") as file:
             return file.read()
     except FileNotFoundError:
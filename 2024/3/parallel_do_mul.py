@@ -0,0 +1,122 @@
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# Bytes version of the do_mul pattern, so chunks can be matched straight off the mapped file
+PATTERN = re.compile(rb"mul\((\d+),(\d+)\)|do\(\)|don't\(\)")
+
+
+def chunk_matches(memory, start, end):
+    """
+    Find the instructions that start within one byte range, without scanning past it.
+    Every match inside the range is found with endpos; only one instruction can
+    straddle the end, and it must start at the range's last 'm' or 'd' since no
+    other instruction start fits inside one, so a single anchored match finds it.
+    :param memory: The mapped input file.
+    :param start: First byte offset of the range.
+    :param end: Byte offset just past the range.
+    :return: A generator of matches in file order.
+    """
+    last_end = start
+
+    for match in PATTERN.finditer(memory, start, end):
+        last_end = match.end()
+        yield match
+
+    tail = max(memory.rfind(b"m", last_end, end), memory.rfind(b"d", last_end, end))
+    if tail != -1:
+        match = PATTERN.match(memory, tail)
+        if match and match.end() > end:
+            yield match
+
+
+def summarize_chunk(file_path, start, end):
+    """
+    Summarize the instructions that start within one byte range of the input file.
+    Instructions may run past the end of the range; the chunk that holds an
+    instruction's first byte owns it.
+    :param file_path: Path to the input file.
+    :param start: First byte offset of the chunk.
+    :param end: Byte offset just past the chunk.
+    :return: A tuple (sum_if_enabled, sum_if_disabled, exit_state), where exit_state
+             is the state set by the chunk's last do()/don't(), or None if it has none.
+    """
+    before_condition = 0  # Counts only if mul is enabled on entry
+    after_condition = 0  # Counts according to the chunk's own do()/don't()
+    state = None
+
+    with open(file_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            for match in chunk_matches(memory, start, end):
+                instruction = match.group(0)
+
+                if instruction == b"do()":
+                    state = True
+                elif instruction == b"don't()":
+                    state = False
+                elif state is None:
+                    before_condition += int(match.group(1)) * int(match.group(2))
+                elif state:
+                    after_condition += int(match.group(1)) * int(match.group(2))
+
+    return before_condition + after_condition, after_condition, state
+
+
+def compose_summaries(summaries, mul_enabled=True):
+    """
+    Fold chunk summaries left to right into a single total.
+    :param summaries: Chunk summaries in file order, as returned by summarize_chunk.
+    :param mul_enabled: State on entry to the first chunk.
+    :return: Total sum of enabled mul results.
+    """
+    total = 0
+
+    for sum_if_enabled, sum_if_disabled, exit_state in summaries:
+        total += sum_if_enabled if mul_enabled else sum_if_disabled
+
+        if exit_state is not None:
+            mul_enabled = exit_state
+
+    return total
+
+
+def parse_and_compute_parallel(file_path, workers=None):
+    """
+    Compute the sum of enabled mul(X,Y) instructions by summarizing chunks of
+    the input file in a process pool.
+    :param file_path: Path to the input file.
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :return: Total sum of results from valid and enabled mul(X,Y) instructions.
+    """
+    try:
+        size = os.path.getsize(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+
+    if size == 0:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    boundaries = sorted({size * i // workers for i in range(workers + 1)})
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(summarize_chunk, file_path, start, end)
+            for start, end in zip(boundaries, boundaries[1:])
+        ]
+        summaries = [future.result() for future in futures]
+
+    return compose_summaries(summaries)
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+
+    try:
+        result = parse_and_compute_parallel(input_file)
+
+        print(f"Total sum of valid and enabled mul instructions: {result}")
+
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,155 @@
+import re
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # Bytes read per chunk
+
+# Scanner states. Literal transitions live in TRANSITIONS; the number states
+# X_FIRST, X_DIGITS, Y_FIRST and Y_DIGITS are handled separately.
+IDLE, M, MU, MUL, X_FIRST, X_DIGITS, Y_FIRST, Y_DIGITS = range(8)
+D, DO, DO_OPEN, DON, DON_QUOTE, DONT, DONT_OPEN = range(8, 15)
+
+TRANSITIONS = {
+    (IDLE, ord("m")): M,
+    (IDLE, ord("d")): D,
+    (M, ord("u")): MU,
+    (MU, ord("l")): MUL,
+    (MUL, ord("(")): X_FIRST,
+    (D, ord("o")): DO,
+    (DO, ord("(")): DO_OPEN,
+    (DO, ord("n")): DON,
+    (DON, ord("'")): DON_QUOTE,
+    (DON_QUOTE, ord("t")): DONT,
+    (DONT, ord("(")): DONT_OPEN,
+}
+
+DIGIT_0, DIGIT_9 = ord("0"), ord("9")
+COMMA, CLOSE = ord(","), ord(")")
+
+# Only 'm' and 'd' can start an instruction, so idle stretches are skipped in C
+INSTRUCTION_START = re.compile(rb"[md]")
+
+
+class MemoryScanner:
+    """
+    Byte-level state machine for mul(X,Y), do() and don't() instructions.
+    All partial-token state lives on the scanner, so input can be fed in
+    chunks split at arbitrary byte positions.
+    """
+
+    def __init__(self, trace=None):
+        self.trace = trace
+        self.state = IDLE
+        self.x = 0
+        self.y = 0
+        self.mul_enabled = True
+        self.total = 0
+        self.enabled_total = 0
+
+    def emit_mul(self):
+        """
+        Record a completed mul(X,Y) instruction.
+        """
+        product = self.x * self.y
+        self.total += product
+
+        if self.mul_enabled:
+            self.enabled_total += product
+            if self.trace:
+                self.trace(f"Processing mul({self.x},{self.y}): Enabled -> {self.x} * {self.y} = {product}")
+        elif self.trace:
+            self.trace(f"Ignored mul({self.x},{self.y})")
+
+    def emit_condition(self, enabled):
+        """
+        Record a completed do() or don't() instruction.
+        :param enabled: True for do(), False for don't().
+        """
+        self.mul_enabled = enabled
+
+        if self.trace:
+            if enabled:
+                self.trace("Processing do(): Enabling mul instructions")
+            else:
+                self.trace("Processing don't(): Disabling mul instructions")
+
+    def feed(self, chunk):
+        """
+        Scan one chunk of memory, continuing any token left open by the previous chunk.
+        :param chunk: Bytes of corrupted memory.
+        """
+        state = self.state
+        i, n = 0, len(chunk)
+
+        while i < n:
+            if state == IDLE:
+                match = INSTRUCTION_START.search(chunk, i)
+                if match is None:
+                    break
+                i = match.start()
+
+            byte = chunk[i]
+
+            if state in (X_FIRST, X_DIGITS) and DIGIT_0 <= byte <= DIGIT_9:
+                self.x = (self.x * 10 if state == X_DIGITS else 0) + byte - DIGIT_0
+                state = X_DIGITS
+            elif state == X_DIGITS and byte == COMMA:
+                state = Y_FIRST
+            elif state in (Y_FIRST, Y_DIGITS) and DIGIT_0 <= byte <= DIGIT_9:
+                self.y = (self.y * 10 if state == Y_DIGITS else 0) + byte - DIGIT_0
+                state = Y_DIGITS
+            elif state == Y_DIGITS and byte == CLOSE:
+                self.emit_mul()
+                state = IDLE
+            elif state == DO_OPEN and byte == CLOSE:
+                self.emit_condition(True)
+                state = IDLE
+            elif state == DONT_OPEN and byte == CLOSE:
+                self.emit_condition(False)
+                state = IDLE
+            elif (state, byte) in TRANSITIONS:
+                state = TRANSITIONS[(state, byte)]
+            elif state != IDLE:
+                # A broken token: the same byte may still start a new instruction
+                state = IDLE
+                continue
+
+            i += 1
+
+        self.state = state
+
+
+def scan_file(file_path, chunk_size=DEFAULT_CHUNK_SIZE, trace=None):
+    """
+    Stream the input file through the scanner in fixed-size chunks.
+    :param file_path: Path to the input file.
+    :param chunk_size: Number of bytes read per chunk.
+    :param trace: Optional callable receiving a message for every processed instruction.
+    :return: A tuple (total, enabled_total) of all mul results and of the enabled ones.
+    """
+    scanner = MemoryScanner(trace)
+
+    try:
+        with open(file_path, "rb") as file:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    break
+                scanner.feed(chunk)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+    except Exception as e:
+        raise RuntimeError(f"An error occurred while reading the input file: {e}")
+
+    return scanner.total, scanner.enabled_total
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+
+    try:
+        total, enabled_total = scan_file(input_file)
+
+        print(f"Total sum of valid mul instructions: {total}")
+        print(f"Total sum of valid and enabled mul instructions: {enabled_total}")
+
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,124 @@
+from collections import deque
+
+from meaning_of_christmas import read_grid
+
+LINE_SEPARATOR = "\n"  # Never part of a word, so matches cannot span two lines
+
+
+def extract_lines(grid):
+    """
+    Extract every row, column and diagonal of the grid as a string.
+    :param grid: A 2D list of characters representing the word search grid.
+    :return: A list of strings, one per line of the grid.
+    """
+    rows, cols = len(grid), len(grid[0])
+
+    # Cells on the same down-right diagonal share r - c; on the same down-left diagonal, r + c
+    down_right = [[] for _ in range(rows + cols - 1)]
+    down_left = [[] for _ in range(rows + cols - 1)]
+
+    for r, row in enumerate(grid):
+        for c, char in enumerate(row):
+            down_right[r - c + cols - 1].append(char)
+            down_left[r + c].append(char)
+
+    lines = ["".join(row) for row in grid]
+    lines.extend("".join(column) for column in zip(*grid))
+    lines.extend("".join(diagonal) for diagonal in down_right)
+    lines.extend("".join(diagonal) for diagonal in down_left)
+
+    return lines
+
+
+def build_automaton(patterns):
+    """
+    Build an Aho-Corasick automaton over a list of patterns.
+    :param patterns: List of non-empty strings to search for.
+    :return: A tuple (transitions, fail, outputs): per-state dicts of child states,
+             per-state failure links, and per-state lists of matched pattern indices.
+    """
+    transitions, fail, outputs = [{}], [0], [[]]
+
+    for index, pattern in enumerate(patterns):
+        state = 0
+        for char in pattern:
+            if char not in transitions[state]:
+                transitions.append({})
+                fail.append(0)
+                outputs.append([])
+                transitions[state][char] = len(transitions) - 1
+            state = transitions[state][char]
+        outputs[state].append(index)
+
+    # Breadth-first pass to set failure links and inherit outputs along them
+    queue = deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, child in transitions[state].items():
+            queue.append(child)
+
+            if state:
+                link = fail[state]
+                while link and char not in transitions[link]:
+                    link = fail[link]
+                fail[child] = transitions[link].get(char, 0)
+
+            outputs[child] = outputs[child] + outputs[fail[child]]
+
+    return transitions, fail, outputs
+
+
+def count_patterns(text, patterns):
+    """
+    Count overlapping occurrences of every pattern in a text with a single scan.
+    :param text: The text to search.
+    :param patterns: List of non-empty strings to search for.
+    :return: A list of counts, one per pattern.
+    """
+    transitions, fail, outputs = build_automaton(patterns)
+    counts = [0] * len(patterns)
+    state = 0
+
+    for char in text:
+        while state and char not in transitions[state]:
+            state = fail[state]
+        state = transitions[state].get(char, 0)
+
+        for index in outputs[state]:
+            counts[index] += 1
+
+    return counts
+
+
+def find_words(grid, words):
+    """
+    Count all occurrences of several words in the grid, considering all eight directions.
+    Each word and its reverse are matched along every row, column and diagonal.
+    :param grid: A 2D list of characters representing the word search grid.
+    :param words: The words to search for.
+    :return: A dictionary mapping each word to its total count.
+    """
+    words = list(dict.fromkeys(words))
+    patterns = words + [word[::-1] for word in words]
+
+    counts = count_patterns(LINE_SEPARATOR.join(extract_lines(grid)), patterns)
+
+    return {word: counts[i] + counts[i + len(words)] for i, word in enumerate(words)}
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+    words_to_find = ["XMAS"]
+
+    try:
+        # Read the grid from the input file
+        grid = read_grid(input_file)
+
+        # Count every word in a single pass over the grid's lines
+        word_counts = find_words(grid, words_to_find)
+
+        for word, total_occurrences in word_counts.items():
+            print(f"Total occurrences of '{word}': {total_occurrences}")
+
+    except Exception as e:
+        print(f"Error: {e}")
@@ -1,12 +1,19 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from grid import Grid
+
+
 def read_grid(file_path):
     """
     Read the word search grid from the input file.
     :param file_path: Path to the input file.
-    :return: A 2D list of characters representing the grid.
+    :return: A Grid holding the word search.
     """
     try:
-        with open(file_path, "r") as file:
-            return [list(line.strip()) for line in file.readlines()]
+        return Grid.from_file(file_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Input file '{file_path}' not found.")
     except Exception as e:
@@ -15,38 +22,29 @@ def read_grid(file_path):
 def find_word(grid, word):
     """
     Count all occurrences of a word in the grid, considering all directions.
-    :param grid: A 2D list of characters representing the word search grid.
+    :param grid: A Grid holding the word search.
     :param word: The word to search for.
     :return: The total count of occurrences of the word.
     """
-    rows, cols = len(grid), len(grid[0])
-    word_length = len(word)
-    directions = [
-        (0, 1),  # Horizontal right
-        (0, -1),  # Horizontal left
-        (1, 0),  # Vertical down
-        (-1, 0),  # Vertical up
-        (1, 1),  # Diagonal down-right
-        (-1, -1),  # Diagonal up-left
-        (1, -1),  # Diagonal down-left
-        (-1, 1)  # Diagonal up-right
-    ]
+    cells = grid.cells
+    letters = word.encode()
+    directions = grid.directions + grid.diagonals  # All eight directions
 
-    def is_valid(x, y, dx, dy):
+    def is_valid(start, step):
         """
-        Check if the word can fit starting at (x, y) in the given direction.
+        Check if the word can fit starting at the given cell in the given direction.
+        The sentinel border never matches a letter, so no bounds checks are needed.
         """
-        for i in range(word_length):
-            nx, ny = x + i * dx, y + i * dy
-            if not (0 <= nx < rows and 0 <= ny < cols) or grid[nx][ny] != word[i]:
+        for i in range(1, len(letters)):
+            if cells[start + i * step] != letters[i]:
                 return False
         return True
 
     count = 0
-    for x in range(rows):
-        for y in range(cols):
-            for dx, dy in directions:
-                if is_valid(x, y, dx, dy):
+    for start in grid.indices():
+        if cells[start] == letters[0]:
+            for step in directions:
+                if is_valid(start, step):
                     count += 1
 
     return count
@@ -1,12 +1,19 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from grid import Grid
+
+
 def read_grid(file_path):
     """
     Read the word search grid from the input file.
     :param file_path: Path to the input file.
-    :return: A 2D list of characters representing the grid.
+    :return: A Grid holding the word search.
     """
     try:
-        with open(file_path, "r") as file:
-            return [list(line.strip()) for line in file.readlines()]
+        return Grid.from_file(file_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Input file '{file_path}' not found.")
     except Exception as e:
@@ -15,41 +22,24 @@ def read_grid(file_path):
 def count_x_mas(grid):
     """
     Count all occurrences of X-MAS patterns in the grid.
-    :param grid: A 2D list of characters representing the word search grid.
+    :param grid: A Grid holding the word search.
     :return: The total count of X-MAS patterns.
     """
-    rows, cols = len(grid), len(grid[0])
+    cells = grid.cells
     count = 0
 
-    # Define the diagonal offsets
-    diagonals = [
-        (-1, -1), (-1, 1),  # Top-left, Top-right
-        (1, -1), (1, 1)     # Bottom-left, Bottom-right
-    ]
+    # Diagonal offsets: Top-left, Top-right, Bottom-left, Bottom-right
+    top_left, top_right, bottom_left, bottom_right = grid.diagonals
 
-    for x in range(1, rows - 1):
-        for y in range(1, cols - 1):
-            if grid[x][y] == "A":  # Center must be "A"
-                # Gather diagonal neighbors
-                neighbors = [
-                    (x + dx, y + dy) for dx, dy in diagonals
-                    if 0 <= x + dx < rows and 0 <= y + dy < cols
-                ]
-                # Count M's and S's among diagonal neighbors
-                m_count = sum(1 for nx, ny in neighbors if grid[nx][ny] == "M")
-                s_count = sum(1 for nx, ny in neighbors if grid[nx][ny] == "S")
+    # Each diagonal must hold one "M" and one "S", in either order
+    m_and_s = {(ord("M"), ord("S")), (ord("S"), ord("M"))}
+    a = ord("A")
 
-                # Check if there are 2 M's and 2 S's
-                if m_count == 2 and s_count == 2:
-                    # Check if each M has an opposite S
-                    m_positions = [(nx, ny) for nx, ny in neighbors if grid[nx][ny] == "M"]
-                    s_positions = [(nx, ny) for nx, ny in neighbors if grid[nx][ny] == "S"]
-                    if any(
-                        (mx + sx == 2 * x and my + sy == 2 * y)
-                        for mx, my in m_positions
-                        for sx, sy in s_positions
-                    ):
-                        count += 1
+    for i in grid.indices():
+        if cells[i] == a:  # Center must be "A"; border neighbors are sentinels and never match
+            if (cells[i + top_left], cells[i + bottom_right]) in m_and_s and \
+                    (cells[i + top_right], cells[i + bottom_left]) in m_and_s:
+                count += 1
 
     return count
 
@@ -0,0 +1,125 @@
+import numpy as np
+
+DIRECTIONS = [
+    (0, 1),  # Horizontal right
+    (0, -1),  # Horizontal left
+    (1, 0),  # Vertical down
+    (-1, 0),  # Vertical up
+    (1, 1),  # Diagonal down-right
+    (-1, -1),  # Diagonal up-left
+    (1, -1),  # Diagonal down-left
+    (-1, 1)  # Diagonal up-right
+]
+
+
+def read_grid_array(file_path):
+    """
+    Read the word search grid from the input file as a 2D uint8 array.
+    :param file_path: Path to the input file.
+    :return: A 2D uint8 array of character codes.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            return grid_to_array(line.strip() for line in file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+    except Exception as e:
+        raise RuntimeError(f"An error occurred while reading the input file: {e}")
+
+
+def grid_to_array(grid):
+    """
+    Convert a grid of rows into a 2D uint8 array.
+    :param grid: Rows as lists of characters, strings or bytes.
+    :return: A 2D uint8 array of character codes.
+    """
+    rows = [row if isinstance(row, bytes) else "".join(row).encode() for row in grid]
+    return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), -1)
+
+
+def shifted(plane, top, bottom, left, right, dr, dc):
+    """
+    Take the window [top:bottom, left:right] of a plane, shifted by (dr, dc).
+    :param plane: A 2D uint8 array of character codes.
+    :param top: First row of the window.
+    :param bottom: Row just past the window.
+    :param left: First column of the window.
+    :param right: Column just past the window.
+    :param dr: Row offset of the shift.
+    :param dc: Column offset of the shift.
+    :return: A view of the shifted window.
+    """
+    return plane[top + dr:bottom + dr, left + dc:right + dc]
+
+
+def find_word_vectorized(plane, word):
+    """
+    Count all occurrences of a word in the grid, considering all directions.
+    For each direction, the plane is compared against each letter of the word at
+    the matching offset and the comparisons are AND-ed together.
+    :param plane: A 2D uint8 array of character codes.
+    :param word: The word to search for.
+    :return: The total count of occurrences of the word.
+    """
+    rows, cols = plane.shape
+    span = len(word) - 1
+    letters = word.encode()
+    count = 0
+
+    for dr, dc in DIRECTIONS:
+        # Start cells from which the whole word stays inside the grid
+        top, bottom = max(0, -span * dr), rows - max(0, span * dr)
+        left, right = max(0, -span * dc), cols - max(0, span * dc)
+        if top >= bottom or left >= right:
+            continue
+
+        matches = np.ones((bottom - top, right - left), dtype=bool)
+        for i, letter in enumerate(letters):
+            matches &= shifted(plane, top, bottom, left, right, i * dr, i * dc) == letter
+
+        count += int(matches.sum())
+
+    return count
+
+
+def count_x_mas_vectorized(plane):
+    """
+    Count all occurrences of X-MAS patterns in the grid.
+    An X-MAS is an interior "A" whose two diagonals each hold one "M" and one "S".
+    :param plane: A 2D uint8 array of character codes.
+    :return: The total count of X-MAS patterns.
+    """
+    rows, cols = plane.shape
+    if rows < 3 or cols < 3:
+        return 0
+
+    m, s = ord("M"), ord("S")
+
+    def corner(dr, dc):
+        return shifted(plane, 1, rows - 1, 1, cols - 1, dr, dc)
+
+    top_left, top_right = corner(-1, -1), corner(-1, 1)
+    bottom_left, bottom_right = corner(1, -1), corner(1, 1)
+
+    main_diagonal = ((top_left == m) & (bottom_right == s)) | ((top_left == s) & (bottom_right == m))
+    anti_diagonal = ((top_right == m) & (bottom_left == s)) | ((top_right == s) & (bottom_left == m))
+
+    return int(((corner(0, 0) == ord("A")) & main_diagonal & anti_diagonal).sum())
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+    word_to_find = "XMAS"
+
+    try:
+        # Read the grid from the input file
+        plane = read_grid_array(input_file)
+
+        total_occurrences = find_word_vectorized(plane, word_to_find)
+        total_x_mas = count_x_mas_vectorized(plane)
+
+        print(f"Total occurrences of '{word_to_find}': {total_occurrences}")
+        print(f"Total occurrences of X-MAS: {total_x_mas}")
+
+    except Exception as e:
+        print(f"Error: {e}")
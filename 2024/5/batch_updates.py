@@ -0,0 +1,214 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from chunks import chunk_boundaries
+from rule_index import RuleOrder
+
+# Rule index attached by each worker process
+worker_memory = None
+worker_index = None
+
+
+class SharedRuleIndex(RuleOrder):
+    """
+    Read-only rule lookups backed by a page-by-page bit matrix in shared memory,
+    so a process pool can use one copy of the rule book. Bit (i, j) is set when
+    page i must be printed before page j.
+    """
+
+    def __init__(self, buffer, page_ids, stride):
+        self.buffer = buffer
+        self.page_ids = page_ids
+        self.stride = stride
+
+    @staticmethod
+    def build_matrix(rules):
+        """
+        Pack the rules into a bit matrix.
+        :param rules: List of ordering rules as tuples (X, Y).
+        :return: A tuple (matrix, page_ids, stride) of the packed bytes, the page-to-row
+                 mapping and the number of bytes per row.
+        """
+        page_ids = {page: i for i, page in enumerate(sorted({page for rule in rules for page in rule}))}
+        stride = (len(page_ids) + 7) // 8
+        matrix = bytearray(max(1, len(page_ids) * stride))
+
+        for x, y in rules:
+            i, j = page_ids[x], page_ids[y]
+            matrix[i * stride + j // 8] |= 1 << (j % 8)
+
+        return matrix, page_ids, stride
+
+    def must_precede(self, x, y):
+        """
+        Check whether a rule requires page x to be printed before page y.
+        :param x: First page number.
+        :param y: Second page number.
+        :return: True if bit (x, y) is set in the shared matrix; otherwise False.
+        """
+        i, j = self.page_ids.get(x), self.page_ids.get(y)
+        if i is None or j is None:
+            return False
+        return bool(self.buffer[i * self.stride + j // 8] >> (j % 8) & 1)
+
+    def row(self, page):
+        """
+        Read the matrix row of a page as an integer bit mask.
+        :param page: Page number.
+        :return: A mask with bit j set for every page j that must come after the page.
+        """
+        i = self.page_ids.get(page)
+        if i is None:
+            return 0
+        return int.from_bytes(self.buffer[i * self.stride:(i + 1) * self.stride], "little")
+
+    def successors_within(self, page, pages):
+        """
+        Find the pages of an update that a rule requires to come after a page.
+        :param page: Page number.
+        :param pages: Set of page numbers in the update.
+        :return: The set of pages y in pages with a rule page|y.
+        """
+        row = self.row(page)
+        return {other for other in pages if other in self.page_ids and row >> self.page_ids[other] & 1}
+
+    def is_update_valid(self, update):
+        """
+        Check if an update is valid by testing each page's row against a mask of the
+        pages printed before it.
+        :param update: List of page numbers in the update.
+        :return: True if the update respects the rules; otherwise False.
+        """
+        seen = 0
+
+        for page in update:
+            if self.row(page) & seen:
+                return False
+
+            i = self.page_ids.get(page)
+            if i is not None:
+                seen |= 1 << i
+
+        return True
+
+
+def parse_rules(file_path):
+    """
+    Parse the ordering rules from a rule book file.
+    Lines without a "|" (such as an updates section) are ignored.
+    :param file_path: Path to the rule book.
+    :return: List of ordering rules as tuples (X, Y).
+    """
+    try:
+        with open(file_path, "r") as file:
+            return [tuple(map(int, line.split("|"))) for line in file if "|" in line]
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file '{file_path}' not found.")
+    except Exception as e:
+        raise RuntimeError(f"An error occurred while reading the input file: {e}")
+
+
+def attach_index(name, page_ids, stride):
+    """
+    Pool initializer: attach to the shared rule matrix once per worker.
+    :param name: Name of the shared memory block.
+    :param page_ids: Mapping from page number to matrix row.
+    :param stride: Number of bytes per matrix row.
+    """
+    global worker_memory, worker_index
+
+    worker_memory = shared_memory.SharedMemory(name=name)
+    worker_index = SharedRuleIndex(worker_memory.buf, page_ids, stride)
+
+
+def process_chunk(file_path, start, end):
+    """
+    Validate the updates within one byte range of an update file.
+    Rule lines and blank lines in the range are skipped.
+    :param file_path: Path to the update file.
+    :param start: Byte offset of the first line in the chunk.
+    :param end: Byte offset just past the last line in the chunk.
+    :return: A tuple (valid_total, reordered_total) of middle-page sums.
+    """
+    valid_total = 0
+    reordered_total = 0
+
+    with open(file_path, "rb") as f:
+        f.seek(start)
+
+        while f.tell() < end:
+            line = f.readline().strip()
+            if not line or b"|" in line:
+                continue
+
+            update = list(map(int, line.split(b",")))
+            if worker_index.is_update_valid(update):
+                valid_total += update[len(update) // 2]
+            else:
+                reordered_total += worker_index.middle_page(update)
+
+    return valid_total, reordered_total
+
+
+def process_files(rules_path, update_paths, workers=None, chunks_per_file=1):
+    """
+    Validate many update files against one rule book in a process pool.
+    The rules are parsed and packed once into shared memory; each file (or each
+    line-aligned chunk of a large file) is processed by a worker.
+    :param rules_path: Path to the rule book.
+    :param update_paths: Paths to the update files.
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :param chunks_per_file: Number of chunks each update file is split into.
+    :return: A dictionary mapping each update file to (valid_total, reordered_total).
+    """
+    matrix, page_ids, stride = SharedRuleIndex.build_matrix(parse_rules(rules_path))
+
+    for path in update_paths:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Input file '{path}' not found.")
+
+    memory = shared_memory.SharedMemory(create=True, size=len(matrix))
+    try:
+        memory.buf[:len(matrix)] = matrix
+
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1,
+            initializer=attach_index,
+            initargs=(memory.name, page_ids, stride),
+        ) as executor:
+            futures = [
+                (path, executor.submit(process_chunk, path, start, end))
+                for path in update_paths
+                for start, end in chunk_boundaries(path, chunks_per_file)
+            ]
+
+            totals = {path: [0, 0] for path in update_paths}
+            for path, future in futures:
+                valid_total, reordered_total = future.result()
+                totals[path][0] += valid_total
+                totals[path][1] += reordered_total
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return {path: tuple(sums) for path, sums in totals.items()}
+
+
+if __name__ == "__main__":
+    # Usage: batch_updates.py [rules_file] [update_file ...]
+    rules_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    update_files = sys.argv[2:] or [rules_file]
+
+    try:
+        results = process_files(rules_file, update_files)
+
+        for path, (valid_total, reordered_total) in results.items():
+            print(f"{path}: Total sum of middle page numbers: {valid_total}")
+            print(f"{path}: Total sum of middle page numbers after reordering: {reordered_total}")
+
+    except Exception as e:
+        print(f"Error: {e}")
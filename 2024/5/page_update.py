@@ -1,3 +1,6 @@
+from rule_index import RuleIndex
+
+
 def parse_input(file_path):
     """
     Parse the input file into ordering rules and updates.
@@ -57,11 +60,12 @@ def find_middle_page(update):
 def main(file_path):
     # Parse the input
     rules, updates = parse_input(file_path)
+    rule_index = RuleIndex(rules)
 
     # Validate updates and calculate the sum of middle page numbers
     total_middle_pages = 0
     for update in updates:
-        if is_update_valid(update, rules):
+        if rule_index.is_update_valid(update):
             middle_page = find_middle_page(update)
             total_middle_pages += middle_page
 
@@ -1,5 +1,7 @@
 from collections import defaultdict, deque
 
+from rule_index import RuleIndex
+
 
 def parse_input(file_path):
     """
@@ -54,6 +56,7 @@ def reorder_update(update, rules):
     :param update: List of page numbers in the update.
     :param rules: List of ordering rules as tuples (X, Y).
     :return: The reordered update.
+    :raises ValueError: If the rules restricted to the update contain a cycle.
     """
     # Create a graph and in-degree map for the pages in this update
     graph = defaultdict(list)
@@ -80,6 +83,11 @@ def reorder_update(update, rules):
             if in_degree[neighbor] == 0:
                 queue.append(neighbor)
 
+    # Pages on a cycle never reach in-degree zero; fail loudly instead of returning a truncated order
+    if len(set(sorted_pages)) < len(pages_in_update):
+        cycle = [page for page in update if page not in set(sorted_pages)]
+        raise ValueError(f"Rules form a cycle among pages {cycle} of update {update}")
+
     return sorted_pages
 
 
@@ -95,12 +103,13 @@ def find_middle_page(update):
 def main(file_path):
     # Parse the input
     rules, updates = parse_input(file_path)
+    rule_index = RuleIndex(rules)
 
     # Identify and reorder invalid updates
     total_middle_pages = 0
     for update in updates:
-        if not is_update_valid(update, rules):  # If the update is invalid
-            reordered_update = reorder_update(update, rules)
+        if not rule_index.is_update_valid(update):  # If the update is invalid
+            reordered_update = rule_index.topological_order(update)
             middle_page = find_middle_page(reordered_update)
             total_middle_pages += middle_page
             print(f"Reordered update: {reordered_update}, Middle page: {middle_page}")
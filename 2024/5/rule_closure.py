@@ -0,0 +1,255 @@
+from page_update import parse_input
+
+
+class RuleClosure:
+    """
+    Bitset view of the ordering rules. Every page gets a bit; each page keeps
+    bitsets of its direct successors and predecessors, plus the bitset of every
+    page reachable from it (the transitive closure), computed once over the
+    strongly connected components of the rule graph.
+
+    The closure answers "must x precede y" for the rule book as a whole. Updates
+    are still checked against the direct rules only, because a chain of rules
+    through pages outside an update does not constrain that update.
+    """
+
+    def __init__(self, rules):
+        self.pages = sorted({page for rule in rules for page in rule})
+        self.bit = {page: i for i, page in enumerate(self.pages)}
+
+        size = len(self.pages)
+        self.adjacency = [[] for _ in range(size)]
+        self.successor_bits = [0] * size
+        self.predecessor_bits = [0] * size
+
+        for x, y in rules:
+            i, j = self.bit[x], self.bit[y]
+            if not self.successor_bits[i] >> j & 1:
+                self.adjacency[i].append(j)
+            self.successor_bits[i] |= 1 << j
+            self.predecessor_bits[j] |= 1 << i
+
+        self.components = self.strongly_connected_components()
+        self.component_of = [0] * size
+        for c, component in enumerate(self.components):
+            for i in component:
+                self.component_of[i] = c
+
+        self.cyclic_components = [
+            [self.pages[i] for i in component]
+            for component in self.components
+            if len(component) > 1 or self.successor_bits[component[0]] >> component[0] & 1
+        ]
+
+        self.reach_bits = self.transitive_closure()
+
+    def strongly_connected_components(self):
+        """
+        Find the strongly connected components of the rule graph with an iterative Tarjan search.
+        :return: A list of components (lists of page bits), sinks first.
+        """
+        size = len(self.pages)
+        index = [-1] * size
+        low = [0] * size
+        on_stack = [False] * size
+        stack, components = [], []
+        counter = 0
+
+        for root in range(size):
+            if index[root] != -1:
+                continue
+
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+
+                if child == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                else:
+                    low[node] = min(low[node], low[self.adjacency[node][child - 1]])
+
+                # Descend into the next unvisited successor, if any
+                while child < len(self.adjacency[node]):
+                    successor = self.adjacency[node][child]
+                    child += 1
+                    if index[successor] == -1:
+                        work.append((node, child))
+                        work.append((successor, 0))
+                        break
+                    if on_stack[successor]:
+                        low[node] = min(low[node], index[successor])
+                else:
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+
+        return components
+
+    def transitive_closure(self):
+        """
+        Compute, for every page, the bitset of pages reachable from it.
+        Components come sinks first, so each one can reuse the closure of its successors.
+        :return: A list of reachability bitsets, one per page bit.
+        """
+        reach_bits = [0] * len(self.pages)
+
+        for c, component in enumerate(self.components):
+            reach = 0
+            for i in component:
+                for j in self.adjacency[i]:
+                    reach |= 1 << j
+                    if self.component_of[j] != c:
+                        reach |= reach_bits[j]
+
+            for i in component:
+                reach_bits[i] = reach
+
+        return reach_bits
+
+    def must_precede(self, x, y):
+        """
+        Check whether the rules, followed transitively, require page x before page y.
+        :param x: First page number.
+        :param y: Second page number.
+        :return: True if y is reachable from x in the rule graph; otherwise False.
+        """
+        if x not in self.bit or y not in self.bit:
+            return False
+        return bool(self.reach_bits[self.bit[x]] >> self.bit[y] & 1)
+
+    def update_bits(self, update):
+        """
+        Map the pages of an update to their bits, skipping pages no rule mentions.
+        :param update: List of page numbers in the update.
+        :return: A list of page bits in update order.
+        """
+        return [self.bit[page] for page in update if page in self.bit]
+
+    def find_cycle(self, update):
+        """
+        Find the pages of an update whose rules, restricted to the update, form a cycle.
+        A cycle can only involve pages from the same cyclic component, so most
+        updates are cleared by a component lookup alone.
+        :param update: List of page numbers in the update.
+        :return: The pages left over once every orderable page is removed (empty if none).
+        """
+        bits = self.update_bits(update)
+        components = [self.component_of[i] for i in bits]
+        if len(set(components)) == len(components) and not any(
+            self.successor_bits[i] >> i & 1 for i in bits
+        ):
+            return []
+
+        _, remaining = self.peel(bits)
+        return [self.pages[i] for i in bits if remaining >> i & 1]
+
+    def peel(self, bits):
+        """
+        Repeatedly remove pages with no remaining predecessor within the update (Kahn's algorithm on bitsets).
+        :param bits: List of page bits in update order.
+        :return: A tuple (order, remaining) of the removed bits in order and the bitset left over.
+        """
+        remaining = 0
+        for i in bits:
+            remaining |= 1 << i
+
+        order = []
+        progress = True
+        while remaining and progress:
+            progress = False
+            for i in bits:
+                if remaining >> i & 1 and not self.predecessor_bits[i] & remaining:
+                    order.append(i)
+                    remaining &= ~(1 << i)
+                    progress = True
+
+        return order, remaining
+
+    def is_update_valid(self, update):
+        """
+        Check if an update is valid according to the rules with one AND per page.
+        :param update: List of page numbers in the update.
+        :return: True if the update respects the rules; otherwise False.
+        """
+        printed = 0
+
+        for page in update:
+            i = self.bit.get(page)
+            if i is None:
+                continue
+            if self.successor_bits[i] & printed:
+                return False
+            printed |= 1 << i
+
+        return True
+
+    def reorder_update(self, update):
+        """
+        Reorder an update according to the rules.
+        :param update: List of page numbers in the update.
+        :return: The reordered update.
+        :raises ValueError: If the rules restricted to the update contain a cycle.
+        """
+        order, remaining = self.peel(self.update_bits(update))
+
+        if remaining:
+            cycle = [self.pages[i] for i in self.update_bits(update) if remaining >> i & 1]
+            raise ValueError(f"Rules form a cycle among pages {cycle} of update {update}")
+
+        # Pages no rule mentions are unconstrained; keep them after the ordered pages
+        return [self.pages[i] for i in order] + [page for page in update if page not in self.bit]
+
+
+def find_cyclic_updates(closure, updates):
+    """
+    Report every update whose rules contain a cycle, before any reordering starts.
+    :param closure: The RuleClosure for the rule book.
+    :param updates: List of updates.
+    :return: A list of (update index, cyclic pages) tuples.
+    """
+    if not closure.cyclic_components:
+        return []  # An acyclic rule book cannot produce a cyclic update
+
+    report = []
+    for i, update in enumerate(updates):
+        cycle = closure.find_cycle(update)
+        if cycle:
+            report.append((i, cycle))
+
+    return report
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+
+    try:
+        rules, updates = parse_input(input_file)
+        closure = RuleClosure(rules)
+
+        for i, cycle in find_cyclic_updates(closure, updates):
+            print(f"Update {i} has cyclic rules among pages {cycle}")
+
+        valid_total = 0
+        reordered_total = 0
+        for update in updates:
+            if closure.is_update_valid(update):
+                valid_total += update[len(update) // 2]
+            else:
+                reordered = closure.reorder_update(update)
+                reordered_total += reordered[len(reordered) // 2]
+
+        print(f"Rule book has {len(closure.cyclic_components)} cyclic component(s)")
+        print(f"Total sum of middle page numbers: {valid_total}")
+        print(f"Total sum of middle page numbers after reordering: {reordered_total}")
+
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,46 @@
+from update_engine import UpdateEngine
+
+# Rules forming the total order 7, 6, 2, 3, 1, 5, 4
+ORDER = [7, 6, 2, 3, 1, 5, 4]
+RULES = [(x, y) for i, x in enumerate(ORDER) for y in ORDER[i + 1:]]
+
+
+def test_remove_rule_keeps_middle_page_of_implied_order():
+    engine = UpdateEngine(RULES, [[5, 3, 1, 7, 6]])
+    assert engine.reordered_total == 3
+
+    # 7|6 and 6|1 still force the order 7, 6, 3, 1, 5
+    engine.remove_rule(7, 1)
+    assert engine.reordered_total == 3
+    assert engine.valid_total == 0
+
+
+def test_remove_rule_can_make_update_valid():
+    engine = UpdateEngine([(1, 2), (2, 3)], [[2, 1, 3]])
+    assert engine.reordered_total == 2
+
+    engine.remove_rule(1, 2)
+    assert engine.valid_total == 1
+    assert engine.reordered_total == 0
+
+
+def test_rule_creating_cycle_is_rejected_and_rolled_back():
+    engine = UpdateEngine([(1, 2), (2, 3), (1, 3)], [[3, 2, 1], [1, 2, 3]])
+    assert (engine.valid_total, engine.reordered_total) == (2, 2)
+
+    try:
+        engine.add_rule(2, 1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("add_rule(2, 1) should reject the 1/2 cycle")
+
+    assert not engine.rule_index.must_precede(2, 1)
+    assert (engine.valid_total, engine.reordered_total) == (2, 2)
+
+    # Flipping the rule in the other order goes through cleanly
+    engine.remove_rule(1, 2)
+    engine.add_rule(2, 1)
+    fresh = UpdateEngine([(2, 3), (1, 3), (2, 1)], [[3, 2, 1], [1, 2, 3]])
+    assert (engine.valid_total, engine.reordered_total) == (fresh.valid_total, fresh.reordered_total) == (0, 2)
+    assert engine.valid == fresh.valid
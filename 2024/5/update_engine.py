@@ -0,0 +1,141 @@
+from collections import defaultdict
+
+from page_update import parse_input
+from rule_index import RuleIndex
+
+
+class UpdateEngine:
+    """
+    Long-lived Day 5 engine that keeps both middle-page sums current as rules and
+    updates change. An inverted index from page to the updates containing it
+    limits each rule change to the updates holding both of its pages.
+    """
+
+    def __init__(self, rules=(), updates=()):
+        self.rule_index = RuleIndex(rules)
+        self.updates = []
+        self.updates_by_page = defaultdict(set)
+
+        # Cached per-update state: validity and middle page (after reordering if invalid)
+        self.valid = []
+        self.middle_pages = []
+
+        self.valid_total = 0  # Sum of middle pages of valid updates
+        self.reordered_total = 0  # Sum of middle pages of reordered invalid updates
+
+        for update in updates:
+            self.add_update(update)
+
+    def add_update(self, update):
+        """
+        Add an update and include it in the running sums.
+        :param update: List of page numbers in the update.
+        :return: The id of the new update.
+        """
+        update = list(update)
+        state = self.compute_state(update)  # Raises before anything is recorded
+
+        update_id = len(self.updates)
+        self.updates.append(update)
+        self.valid.append(True)
+        self.middle_pages.append(0)
+
+        for page in update:
+            self.updates_by_page[page].add(update_id)
+
+        self.apply_state(update_id, state)
+        return update_id
+
+    def add_rule(self, x, y):
+        """
+        Add a rule and re-evaluate only the updates containing both of its pages.
+        :param x: First page number.
+        :param y: Second page number.
+        :raises ValueError: If the rule creates a cycle within an affected update;
+                            the rule is then not added.
+        """
+        if self.rule_index.add_rule(x, y):
+            try:
+                self.evaluate_affected(x, y)
+            except ValueError:
+                self.rule_index.remove_rule(x, y)
+                raise
+
+    def remove_rule(self, x, y):
+        """
+        Remove a rule and re-evaluate only the updates containing both of its pages.
+        :param x: First page number.
+        :param y: Second page number.
+        :raises ValueError: If an affected update cannot be reordered; the rule is then kept.
+        """
+        if self.rule_index.remove_rule(x, y):
+            try:
+                self.evaluate_affected(x, y)
+            except ValueError:
+                self.rule_index.add_rule(x, y)
+                raise
+
+    def evaluate_affected(self, x, y):
+        """
+        Re-evaluate every update that contains both pages of a rule.
+        All new states are computed before any is applied, so a failure leaves the
+        cached states and running sums untouched.
+        :param x: First page number.
+        :param y: Second page number.
+        """
+        affected = self.updates_by_page.get(x, set()) & self.updates_by_page.get(y, set())
+        states = [(update_id, self.compute_state(self.updates[update_id])) for update_id in affected]
+
+        for update_id, state in states:
+            self.apply_state(update_id, state)
+
+    def evaluate(self, update_id):
+        """
+        Recompute one update's validity and middle page, and patch the running sums.
+        :param update_id: The id of the update to evaluate.
+        """
+        self.apply_state(update_id, self.compute_state(self.updates[update_id]))
+
+    def compute_state(self, update):
+        """
+        Compute an update's validity and middle page under the current rules.
+        :param update: List of page numbers in the update.
+        :return: A tuple (valid, middle_page), the middle page taken after reordering if invalid.
+        :raises ValueError: If the rules restricted to the update contain a cycle.
+        """
+        if self.rule_index.is_update_valid(update):
+            return True, update[len(update) // 2]
+        return False, self.rule_index.middle_page(update)
+
+    def apply_state(self, update_id, state):
+        """
+        Replace an update's cached state and move its contribution between the running sums.
+        :param update_id: The id of the update.
+        :param state: A tuple (valid, middle_page) as returned by compute_state.
+        """
+        # Take the update's previous contribution out of the sums
+        if self.valid[update_id]:
+            self.valid_total -= self.middle_pages[update_id]
+        else:
+            self.reordered_total -= self.middle_pages[update_id]
+
+        self.valid[update_id], self.middle_pages[update_id] = state
+
+        if self.valid[update_id]:
+            self.valid_total += self.middle_pages[update_id]
+        else:
+            self.reordered_total += self.middle_pages[update_id]
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Default file path
+
+    try:
+        rules, updates = parse_input(input_file)
+        engine = UpdateEngine(rules, updates)
+
+        print(f"Total sum of middle page numbers: {engine.valid_total}")
+        print(f"Total sum of middle page numbers after reordering: {engine.reordered_total}")
+
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,151 @@
+from bisect import bisect_left
+
+from time_patrol import count_off_route_loops, parse_map, record_route
+
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # Up, Right, Down, Left
+
+
+class ObstacleIndex:
+    """
+    Sorted obstacle positions for every row and every column of a map, so the
+    guard can jump straight to the next obstacle in O(log n) per segment.
+    An extra obstruction can be supplied per query without touching the map.
+    """
+
+    def __init__(self, grid):
+        self.rows, self.cols = grid.rows, grid.cols
+        self.in_row = [[] for _ in range(self.rows)]  # Obstacle columns per row
+        self.in_column = [[] for _ in range(self.cols)]  # Obstacle rows per column
+
+        # Row-major scan, so both families of lists come out sorted
+        index = grid.find('#')
+        while index != -1:
+            r, c = grid.position(index)
+            self.in_row[r].append(c)
+            self.in_column[c].append(r)
+            index = grid.cells.find(b'#', index + 1)
+
+    def next_stop(self, r, c, direction_index, extra=None):
+        """
+        Find where the guard stops when walking straight from (r, c).
+        :param r: Current row.
+        :param c: Current column.
+        :param direction_index: Index into DIRECTIONS.
+        :param extra: Optional (row, column) of an additional obstruction.
+        :return: A tuple (r, c, exited): the last cell reached, and whether the guard left the map.
+        """
+        if direction_index in (0, 2):  # Vertical: look along the column
+            line, position, limit = self.in_column[c], r, self.rows
+            extra_position = extra[0] if extra and extra[1] == c else None
+        else:  # Horizontal: look along the row
+            line, position, limit = self.in_row[r], c, self.cols
+            extra_position = extra[1] if extra and extra[0] == r else None
+
+        forward = direction_index in (1, 2)
+        i = bisect_left(line, position)
+        if forward:
+            blocker = line[i] if i < len(line) else None
+            if extra_position is not None and extra_position > position and (blocker is None or extra_position < blocker):
+                blocker = extra_position
+            stop = limit - 1 if blocker is None else blocker - 1
+        else:
+            blocker = line[i - 1] if i > 0 else None
+            if extra_position is not None and extra_position < position and (blocker is None or extra_position > blocker):
+                blocker = extra_position
+            stop = 0 if blocker is None else blocker + 1
+
+        if direction_index in (0, 2):
+            return stop, c, blocker is None
+        return r, stop, blocker is None
+
+
+def walk_segments(obstacles, start_position, direction_index, extra=None):
+    """
+    Walk the guard from obstacle to obstacle.
+    :param obstacles: The ObstacleIndex of the map.
+    :param start_position: The initial (row, column) of the guard.
+    :param direction_index: The initial index into DIRECTIONS.
+    :param extra: Optional (row, column) of an additional obstruction.
+    :return: A tuple (exited, segments): whether the guard leaves the map, and the
+             straight segments walked as ((r1, c1), (r2, c2)) pairs.
+    """
+    r, c = start_position
+    turns = set()
+    segments = []
+
+    while True:
+        next_r, next_c, exited = obstacles.next_stop(r, c, direction_index, extra)
+        segments.append(((r, c), (next_r, next_c)))
+
+        if exited:
+            return True, segments
+
+        # Loop detection only needs the states at turns
+        r, c = next_r, next_c
+        if (r, c, direction_index) in turns:
+            return False, segments
+        turns.add((r, c, direction_index))
+        direction_index = (direction_index + 1) % 4
+
+
+def count_visited(obstacles, start_position, start_direction):
+    """
+    Count the distinct cells the guard visits by rasterizing its segments into a bitmap.
+    :param obstacles: The ObstacleIndex of the map.
+    :param start_position: The initial position of the guard.
+    :param start_direction: The initial direction of the guard.
+    :return: The number of distinct positions visited.
+    """
+    _, segments = walk_segments(obstacles, start_position, DIRECTIONS.index(start_direction))
+    cols = obstacles.cols
+    visited = bytearray(obstacles.rows * cols)
+
+    for (r1, c1), (r2, c2) in segments:
+        if r1 == r2:  # Horizontal segment: one contiguous slice
+            low, high = min(c1, c2), max(c1, c2)
+            visited[r1 * cols + low:r1 * cols + high + 1] = b"\x01" * (high - low + 1)
+        else:  # Vertical segment: a strided slice down the column
+            low, high = min(r1, r2), max(r1, r2)
+            visited[low * cols + c1:high * cols + c1 + 1:cols] = b"\x01" * (high - low + 1)
+
+    return visited.count(1)
+
+
+def count_loop_obstructions(grid, obstacles, start_position, start_direction):
+    """
+    Count the obstruction positions that trap the guard in a loop.
+    Candidates come from the original route, each check resumes just before the
+    candidate cell, and the obstruction is passed as a virtual extra obstacle.
+    :param grid: The map Grid.
+    :param obstacles: The ObstacleIndex of the map.
+    :param start_position: The initial position of the guard.
+    :param start_direction: The initial direction of the guard.
+    :return: The count of valid obstruction positions.
+    """
+    candidates = record_route(grid, start_position, start_direction)
+    valid_positions = count_off_route_loops(grid, start_position, start_direction, candidates)
+
+    for cell, position, direction_index in candidates:
+        exited, _ = walk_segments(obstacles, grid.position(position), direction_index, grid.position(cell))
+        if not exited:
+            valid_positions += 1
+
+    return valid_positions
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Replace with your file path
+
+    try:
+        # Parse the map and index its obstacles
+        grid, start_position, start_direction = parse_map(input_file)
+        obstacles = ObstacleIndex(grid)
+
+        distinct_positions = count_visited(obstacles, start_position, start_direction)
+        valid_obstruction_count = count_loop_obstructions(grid, obstacles, start_position, start_direction)
+
+        print(f"Number of distinct positions visited: {distinct_positions}")
+        print(f"Number of valid obstruction positions: {valid_obstruction_count}")
+
+    except Exception as e:
+        print(f"Error: {e}")
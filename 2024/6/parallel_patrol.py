@@ -0,0 +1,89 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from grid import Grid
+from time_patrol import StateTracker, count_loop_candidates, count_off_route_loops, parse_map, record_route
+
+# Read-only grid and tracker attached by each worker process
+worker_memory = None
+worker_grid = None
+worker_tracker = None
+
+
+def attach_grid(name, size, rows, cols, stride):
+    """
+    Pool initializer: attach to the shared grid cells once per worker.
+    :param name: Name of the shared memory block.
+    :param size: Number of bytes of grid cells.
+    :param rows: Number of grid rows.
+    :param cols: Number of grid columns.
+    :param stride: Flat index distance between rows.
+    """
+    global worker_memory, worker_grid, worker_tracker
+
+    worker_memory = shared_memory.SharedMemory(name=name)
+    worker_grid = Grid(worker_memory.buf[:size].toreadonly(), rows, cols, stride)
+    worker_tracker = StateTracker(size)
+
+
+def count_slice(candidates):
+    """
+    Count the loop-causing obstructions within one slice of candidates.
+    :param candidates: (cell, position, direction_index) tuples as returned by record_route.
+    :return: The count of candidates that cause a loop.
+    """
+    return count_loop_candidates(worker_grid, candidates, worker_tracker)
+
+
+def find_valid_obstruction_positions_parallel(grid, start_position, start_direction, workers=None):
+    """
+    Find all positions where placing a single obstruction would trap the guard in a loop,
+    testing slices of the candidates in a process pool over a shared read-only grid.
+    :param grid: The map Grid.
+    :param start_position: The initial position of the guard.
+    :param start_direction: The initial direction of the guard.
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :return: The count of valid obstruction positions.
+    """
+    candidates = record_route(grid, start_position, start_direction)
+    workers = workers or os.cpu_count() or 1
+
+    # Interleave candidates so every slice gets a similar mix of short and long routes
+    slices = [candidates[i::workers] for i in range(workers)]
+
+    size = len(grid.cells)
+    memory = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        memory.buf[:size] = grid.cells
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=attach_grid,
+            initargs=(memory.name, size, grid.rows, grid.cols, grid.stride),
+        ) as executor:
+            on_route = sum(executor.map(count_slice, slices))
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return on_route + count_off_route_loops(grid, start_position, start_direction, candidates)
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"  # Replace with your file path
+
+    try:
+        # Parse the map
+        grid, start_position, start_direction = parse_map(input_file)
+
+        # Find valid obstruction positions
+        valid_obstruction_count = find_valid_obstruction_positions_parallel(grid, start_position, start_direction)
+
+        print(f"Number of valid obstruction positions: {valid_obstruction_count}")
+
+    except Exception as e:
+        print(f"Error: {e}")
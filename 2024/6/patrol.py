@@ -1,28 +1,36 @@
+import os
+import sys
 import traceback
+from array import array
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
-def parse_map(file_path):
+from grid import SENTINEL, Grid
+
+
+def parse_map(file_path, trace=None):
     """
     Parse the map input to extract the grid, the guard's initial position, and direction.
     :param file_path: Path to the input file.
+    :param trace: Optional callable receiving a debug message for every row and for the guard.
     :return: A tuple (grid, start_position, direction).
     """
     directions = {'^': (-1, 0), '>': (0, 1), 'v': (1, 0), '<': (0, -1)}
-    grid = []
+    grid = Grid.from_file(file_path)
     start_position = None
     direction = None
 
-    with open(file_path, "r") as file:
-        for r, line in enumerate(file):
-            row = list(line.strip())
-            if row:
-                print(f"Processing row {r}: {row}")  # Debug statement
-                grid.append(row)
-                for c, char in enumerate(row):
-                    if char in directions:
-                        start_position = (r, c)
-                        direction = directions[char]
-                        print(f"Guard found at ({r}, {c}) facing {char}")  # Debug statement
+    if trace:
+        for r, row in enumerate(grid):
+            trace(f"Processing row {r}: {list(row)}")
+
+    for char in directions:
+        index = grid.find(char)
+        if index != -1:
+            r, c = start_position = grid.position(index)
+            direction = directions[char]
+            if trace:
+                trace(f"Guard found at ({r}, {c}) facing {char}")
 
     if not grid:
         raise ValueError("The map is empty.")
@@ -36,37 +44,142 @@ def parse_map(file_path):
 def simulate_guard(grid, start_position, start_direction):
     """
     Simulate the guard's movement and determine the distinct positions visited.
-    :param grid: The 2D map grid.
+    :param grid: The map Grid.
     :param start_position: The initial position of the guard.
     :param start_direction: The initial direction of the guard.
     :return: The number of distinct positions visited.
     """
-    rows, cols = len(grid), len(grid[0])
+    cells = grid.cells
     directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # Up, Right, Down, Left
     direction_index = directions.index(start_direction)
+    steps = grid.directions  # Flat offsets in the same order
+    obstacle = ord('#')
 
     visited = set()
-    current_position = start_position
+    current_position = grid.index(*start_position)
     visited.add(current_position)
 
     while True:
-        r, c = current_position
-        dr, dc = directions[direction_index]
-        next_r, next_c = r + dr, c + dc
+        next_position = current_position + steps[direction_index]
 
         # Check if the guard is about to leave the grid
-        if not (0 <= next_r < rows and 0 <= next_c < cols):
+        if cells[next_position] == SENTINEL:
             break
 
-        # Check if the next cell is within bounds before accessing
-        if 0 <= next_r < rows and 0 <= next_c < cols and grid[next_r][next_c] == '#':
+        if cells[next_position] == obstacle:
             direction_index = (direction_index + 1) % 4  # Turn right
         else:  # Move forward
-            current_position = (next_r, next_c)
+            current_position = next_position
             visited.add(current_position)
 
     return len(visited)
 
+def iter_segments(grid, start_position, start_direction):
+    """
+    Lazily yield the guard's route as straight-line segments.
+    Nothing is allocated per step; each segment is produced when the guard turns or exits.
+    The walk stops when the guard leaves the map or repeats a turn (a loop).
+    :param grid: The map Grid.
+    :param start_position: The initial position of the guard.
+    :param start_direction: The initial direction of the guard.
+    :return: A generator of (start_index, direction_index, length) tuples, where start_index
+             is the flat index the segment starts from and length is the number of steps taken.
+    """
+    cells = grid.cells
+    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # Up, Right, Down, Left
+    direction_index = directions.index(start_direction)
+    steps = grid.directions  # Flat offsets in the same order
+    obstacle = ord('#')
+
+    current_position = grid.index(*start_position)
+    turns = set()
+
+    while True:
+        step = steps[direction_index]
+        segment_start = current_position
+
+        while cells[current_position + step] not in (obstacle, SENTINEL):
+            current_position += step
+
+        if current_position != segment_start:
+            yield segment_start, direction_index, (current_position - segment_start) // step
+
+        if cells[current_position + step] == SENTINEL:
+            return  # Guard leaves the map
+        if (current_position, direction_index) in turns:
+            return  # Guard is stuck in a loop
+        turns.add((current_position, direction_index))
+        direction_index = (direction_index + 1) % 4
+
+class RouteStore:
+    """
+    Compact, array-backed store of a guard route as segments, for downstream analysis.
+    """
+
+    def __init__(self, grid, start_position, segments=()):
+        self.grid = grid
+        self.start_index = grid.index(*start_position)
+        self.starts = array('q')
+        self.directions = array('b')
+        self.lengths = array('q')
+
+        for segment in segments:
+            self.append(*segment)
+
+    @classmethod
+    def from_route(cls, grid, start_position, start_direction):
+        """
+        Record a guard route from the segment generator.
+        :param grid: The map Grid.
+        :param start_position: The initial position of the guard.
+        :param start_direction: The initial direction of the guard.
+        :return: A RouteStore.
+        """
+        return cls(grid, start_position, iter_segments(grid, start_position, start_direction))
+
+    def append(self, start_index, direction_index, length):
+        """
+        Append one segment to the route.
+        :param start_index: Flat index the segment starts from.
+        :param direction_index: Direction of travel (Up, Right, Down, Left).
+        :param length: Number of steps taken along the segment.
+        """
+        self.starts.append(start_index)
+        self.directions.append(direction_index)
+        self.lengths.append(length)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.directions, self.lengths)
+
+    def segments(self):
+        """
+        Iterate over the segments with (row, column) start positions.
+        :return: A generator of ((r, c), direction_index, length) tuples.
+        """
+        for start_index, direction_index, length in self:
+            yield self.grid.position(start_index), direction_index, length
+
+    def count_visited(self):
+        """
+        Count the distinct cells on the route by rasterizing the segments into a bitmap.
+        :return: The number of distinct positions visited.
+        """
+        visited = bytearray(len(self.grid.cells))
+        visited[self.start_index] = 1
+        steps = self.grid.directions
+
+        for start_index, direction_index, length in self:
+            step = steps[direction_index]
+            first, last = start_index + step, start_index + length * step
+            if step < 0:
+                first, last = last, first
+            visited[first:last + 1:abs(step)] = b"\x01" * length
+
+        return visited.count(1)
+
 if __name__ == "__main__":
     input_file = "input.txt"  # Replace with your file path
 
@@ -1,3 +1,11 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from grid import SENTINEL, Grid
+
+
 def parse_map(file_path):
     """
     Parse the map input to extract the grid, the guard's initial position, and direction.
@@ -5,56 +13,127 @@ def parse_map(file_path):
     :return: A tuple (grid, start_position, direction).
     """
     directions = {'^': (-1, 0), '>': (0, 1), 'v': (1, 0), '<': (0, -1)}
-    grid = []
+    grid = Grid.from_file(file_path)
     start_position = None
     direction = None
 
-    with open(file_path, "r") as file:
-        for r, line in enumerate(file):
-            row = list(line.strip())
-            grid.append(row)
-            for c, char in enumerate(row):
-                if char in directions:
-                    start_position = (r, c)
-                    direction = directions[char]
+    for char in directions:
+        index = grid.find(char)
+        if index != -1:
+            start_position = grid.position(index)
+            direction = directions[char]
 
     if not grid or start_position is None or direction is None:
         raise ValueError("Invalid or empty map input.")
 
     return grid, start_position, direction
 
+class StateTracker:
+    """
+    Reusable bitmap of guard states: one byte per grid cell, one bit per direction.
+    Only the cells touched during a run are cleared afterwards, so resetting costs
+    as much as the run itself rather than the whole grid.
+    """
+
+    def __init__(self, size):
+        self.bits = bytearray(size)
+        self.touched = []
+
+    def visit(self, index, direction_index):
+        """
+        Record a state and report whether it had already been recorded.
+        :param index: Flat index of the guard's cell.
+        :param direction_index: The guard's direction index.
+        :return: True if the state was seen before in this run; otherwise False.
+        """
+        mask = 1 << direction_index
+        seen = self.bits[index]
+        if seen & mask:
+            return True
+        if not seen:
+            self.touched.append(index)
+        self.bits[index] = seen | mask
+        return False
+
+    def reset(self):
+        """
+        Clear every state recorded since the last reset.
+        """
+        bits = self.bits
+        for index in self.touched:
+            bits[index] = 0
+        self.touched.clear()
+
+def simulate_guard_tracked(grid, start_index, direction_index, tracker, turns_only=False, extra_obstacle=None):
+    """
+    Simulate the guard's movement with a reusable state tracker instead of a set of tuples.
+    :param grid: The map Grid.
+    :param start_index: Flat index of the guard's initial cell.
+    :param direction_index: The guard's initial direction index (Up, Right, Down, Left).
+    :param tracker: A StateTracker sized for the grid; it is reset before returning.
+    :param turns_only: Record states only when the guard turns. Every loop contains a
+                       turn, so this detects the same loops while recording far fewer states.
+    :param extra_obstacle: Optional flat index treated as an obstruction without modifying the grid.
+    :return: True if the guard exits the grid, False if they get stuck in a loop.
+    """
+    cells = grid.cells
+    steps = grid.directions
+    obstacle = ord('#')
+    current_position = start_index
+
+    try:
+        if not turns_only:
+            tracker.visit(current_position, direction_index)
+
+        while True:
+            next_position = current_position + steps[direction_index]
+
+            if cells[next_position] == SENTINEL:
+                return True
+
+            if cells[next_position] == obstacle or next_position == extra_obstacle:
+                if turns_only and tracker.visit(current_position, direction_index):
+                    return False
+                direction_index = (direction_index + 1) % 4
+            else:
+                current_position = next_position
+                if not turns_only and tracker.visit(current_position, direction_index):
+                    return False
+    finally:
+        tracker.reset()
+
 def simulate_guard(grid, start_position, start_direction):
     """
     Simulate the guard's movement and determine if they leave the grid or get stuck in a loop.
-    :param grid: The 2D map grid.
+    :param grid: The map Grid.
     :param start_position: The initial position of the guard.
     :param start_direction: The initial direction of the guard.
     :return: A tuple (exited, visited_positions).
              - exited: True if the guard exits the grid, False if they get stuck in a loop.
-             - visited_positions: The set of positions and directions visited.
+             - visited_positions: The set of (flat index, direction index) states visited.
     """
-    rows, cols = len(grid), len(grid[0])
+    cells = grid.cells
     directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # Up, Right, Down, Left
     direction_index = directions.index(start_direction)
+    steps = grid.directions  # Flat offsets in the same order
+    obstacle = ord('#')
 
     visited = set()
-    current_position = start_position
+    current_position = grid.index(*start_position)
     visited.add((current_position, direction_index))
 
     while True:
-        r, c = current_position
-        dr, dc = directions[direction_index]
-        next_r, next_c = r + dr, c + dc
+        next_position = current_position + steps[direction_index]
 
         # Check if the guard is about to leave the grid
-        if not (0 <= next_r < rows and 0 <= next_c < cols):
+        if cells[next_position] == SENTINEL:
             return True, visited  # Guard exits the grid
 
         # Check the cell in front of the guard
-        if grid[next_r][next_c] == '#':  # Obstacle in front
+        if cells[next_position] == obstacle:  # Obstacle in front
             direction_index = (direction_index + 1) % 4  # Turn right
         else:  # Move forward
-            current_position = (next_r, next_c)
+            current_position = next_position
             if (current_position, direction_index) in visited:
                 return False, visited  # Guard is stuck in a loop
             visited.add((current_position, direction_index))
@@ -62,33 +141,133 @@ def simulate_guard(grid, start_position, start_direction):
 def find_valid_obstruction_positions(grid, start_position, start_direction):
     """
     Find all positions where placing a single obstruction would cause the guard to get stuck in a loop.
-    :param grid: The 2D map grid.
+    :param grid: The map Grid.
     :param start_position: The initial position of the guard.
     :param start_direction: The initial direction of the guard.
     :return: The count of valid obstruction positions.
     """
-    rows, cols = len(grid), len(grid[0])
+    cells = grid.cells
+    start_index = grid.index(*start_position)
+    direction_index = [(-1, 0), (0, 1), (1, 0), (0, -1)].index(start_direction)
+    tracker = StateTracker(len(cells))
+    obstacle = ord('#')
     valid_positions = 0
 
-    for r in range(rows):
-        for c in range(cols):
-            # Skip starting position and existing obstacles
-            if (r, c) == start_position or grid[r][c] == '#':
-                continue
+    for i in grid.indices():
+        # Skip starting position and existing obstacles
+        if i == start_index or cells[i] == obstacle:
+            continue
+
+        # Temporarily place an obstruction
+        original_value = cells[i]
+        cells[i] = obstacle
+
+        # Simulate guard movement
+        exited = simulate_guard_tracked(grid, start_index, direction_index, tracker, turns_only=True)
+
+        # If the guard gets stuck in a loop, this is a valid position
+        if not exited:
+            valid_positions += 1
+
+        # Restore the original value
+        cells[i] = original_value
+
+    return valid_positions
+
+def record_route(grid, start_position, start_direction):
+    """
+    Walk the guard's original route and record the state just before each cell is first entered.
+    :param grid: The map Grid.
+    :param start_position: The initial position of the guard.
+    :param start_direction: The initial direction of the guard.
+    :return: A list of (cell, position, direction_index) tuples, one per distinct cell on the
+             route other than the start, where (position, direction_index) is the guard's
+             state right before stepping onto the cell for the first time.
+    """
+    cells = grid.cells
+    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # Up, Right, Down, Left
+    direction_index = directions.index(start_direction)
+    steps = grid.directions  # Flat offsets in the same order
+    obstacle = ord('#')
+
+    current_position = grid.index(*start_position)
+    entered = {current_position}
+    states = {(current_position, direction_index)}
+    route = []
+
+    while True:
+        next_position = current_position + steps[direction_index]
+
+        if cells[next_position] == SENTINEL:
+            return route
+
+        if cells[next_position] == obstacle:
+            direction_index = (direction_index + 1) % 4
+            continue
 
-            # Temporarily place an obstruction
-            original_value = grid[r][c]
-            grid[r][c] = '#'
+        if next_position not in entered:
+            entered.add(next_position)
+            route.append((next_position, current_position, direction_index))
 
-            # Simulate guard movement
-            exited, _ = simulate_guard(grid, start_position, start_direction)
+        current_position = next_position
+        if (current_position, direction_index) in states:
+            return route  # The original route already loops; every cell on it has been seen
+        states.add((current_position, direction_index))
 
-            # If the guard gets stuck in a loop, this is a valid position
-            if not exited:
-                valid_positions += 1
+def find_valid_obstruction_positions_on_route(grid, start_position, start_direction):
+    """
+    Find all positions where placing a single obstruction would cause the guard to get stuck in a loop.
+    Only cells on the guard's original route can change its path, and the path up to
+    the first time the guard reaches a candidate is unchanged, so each check resumes
+    from the guard's state just before that cell.
+    :param grid: The map Grid.
+    :param start_position: The initial position of the guard.
+    :param start_direction: The initial direction of the guard.
+    :return: The count of valid obstruction positions.
+    """
+    candidates = record_route(grid, start_position, start_direction)
+
+    return count_loop_candidates(grid, candidates) + count_off_route_loops(grid, start_position, start_direction, candidates)
+
+def count_off_route_loops(grid, start_position, start_direction, candidates, tracker=None):
+    """
+    Count the obstructions off the guard's original route that leave it in a loop.
+    An obstruction the guard never reaches cannot change its path, so these are
+    all the empty cells off the route when the unobstructed guard already loops,
+    and none otherwise.
+    :param grid: The map Grid.
+    :param start_position: The initial position of the guard.
+    :param start_direction: The initial direction of the guard.
+    :param candidates: The route as returned by record_route.
+    :param tracker: Optional StateTracker to reuse.
+    :return: The count of valid obstruction positions off the route.
+    """
+    tracker = tracker or StateTracker(len(grid.cells))
+    direction_index = [(-1, 0), (0, 1), (1, 0), (0, -1)].index(start_direction)
+
+    if simulate_guard_tracked(grid, grid.index(*start_position), direction_index, tracker, True):
+        return 0
+
+    # Every cell except obstacles and the start is a possible obstruction; the route's are counted separately
+    empty_cells = grid.rows * grid.cols - grid.cells.count(b'#') - 1
+    return empty_cells - len(candidates)
+
+def count_loop_candidates(grid, candidates, tracker=None):
+    """
+    Count the candidate obstructions that trap the guard in a loop.
+    The grid is only read: each obstruction is a virtual override.
+    :param grid: The map Grid.
+    :param candidates: (cell, position, direction_index) tuples as returned by record_route.
+    :param tracker: Optional StateTracker to reuse.
+    :return: The count of candidates that cause a loop.
+    """
+    tracker = tracker or StateTracker(len(grid.cells))
+    valid_positions = 0
 
-            # Restore the original value
-            grid[r][c] = original_value
+    for cell, position, direction_index in candidates:
+        # Resume the guard right before it would have stepped onto the obstruction
+        if not simulate_guard_tracked(grid, position, direction_index, tracker, True, cell):
+            valid_positions += 1
 
     return valid_positions
 
@@ -100,7 +279,7 @@ if __name__ == "__main__":
         grid, start_position, start_direction = parse_map(input_file)
 
         # Find valid obstruction positions
-        valid_obstruction_count = find_valid_obstruction_positions(grid, start_position, start_direction)
+        valid_obstruction_count = find_valid_obstruction_positions_on_route(grid, start_position, start_direction)
 
         print(f"Number of valid obstruction positions: {valid_obstruction_count}")
 
@@ -0,0 +1,23 @@
+import os
+
+
+def chunk_boundaries(file_path, num_chunks):
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+    :param file_path: Path to the input file.
+    :param num_chunks: Desired number of chunks.
+    :return: A list of (start, end) byte offsets.
+    """
+    size = os.path.getsize(file_path)
+    boundaries = [0]
+
+    with open(file_path, "rb") as f:
+        for i in range(1, num_chunks):
+            # Move each cut forward to just past the next newline
+            f.seek(max(size * i // num_chunks, boundaries[-1]))
+            f.readline()
+            boundaries.append(min(f.tell(), size))
+
+    boundaries.append(size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
@@ -0,0 +1,136 @@
+import mmap
+
+SENTINEL = 0  # Border byte; never equal to a map character
+
+
+class Grid:
+    """
+    Compact character grid stored in a single bytearray with a sentinel border.
+    Cell (r, c) lives at flat index origin + r * stride + c. Every row is followed
+    by at least one sentinel column and the grid is framed by sentinel rows, so a
+    single step in any of the eight directions from an in-grid cell always lands
+    on a valid index, and leaving the grid shows up as reading SENTINEL.
+    """
+
+    def __init__(self, cells, rows, cols, stride):
+        self.cells = cells
+        self.rows = rows
+        self.cols = cols
+        self.stride = stride
+        self.origin = stride + 1
+
+        # Flat offsets in the order Up, Right, Down, Left
+        self.directions = [-stride, 1, stride, -1]
+        # Flat offsets in the order Up-Left, Up-Right, Down-Left, Down-Right
+        self.diagonals = [-stride - 1, -stride + 1, stride - 1, stride + 1]
+
+    @classmethod
+    def from_buffer(cls, data):
+        """
+        Build a grid from newline-separated rows held in any bytes-like buffer.
+        The row layout of the buffer is kept, so the rows are copied into the
+        padded cells in a single bulk copy.
+        :param data: Bytes-like object (bytes, bytearray, mmap) holding the rows.
+        :return: A Grid.
+        """
+        end = len(data)
+        while end and data[end - 1] in b"\r\n":
+            end -= 1
+
+        if end == 0:
+            return cls(bytearray(2), 0, 0, 1)
+
+        first_newline = data.find(b"\n", 0, end)
+        if first_newline == -1:
+            cols, stride = end, end + 1
+        else:
+            cols = first_newline - (1 if data[first_newline - 1] == ord("\r") else 0)
+            stride = first_newline + 1
+
+        # The last row may be missing its line separator
+        rows = (end + stride - cols) // stride
+        if rows * stride - (stride - cols) != end:
+            raise ValueError("Rows have inconsistent lengths.")
+
+        origin = stride + 1
+        cells = bytearray(origin + (rows + 1) * stride)
+        with memoryview(data) as view:
+            cells[origin:origin + end] = view[:end]
+
+        # Every row must end exactly at column cols, then the separators become sentinels
+        separators = cells[origin + stride - 1:origin + (rows - 1) * stride:stride]
+        if separators.count(b"\n") != rows - 1:
+            raise ValueError("Rows have inconsistent lengths.")
+        for column in range(cols, stride):
+            cells[origin + column::stride] = bytes(len(cells[origin + column::stride]))
+
+        return cls(cells, rows, cols, stride)
+
+    @classmethod
+    def from_file(cls, file_path):
+        """
+        Build a grid by memory-mapping the input file.
+        :param file_path: Path to the input file.
+        :return: A Grid.
+        """
+        with open(file_path, "rb") as file:
+            if not file.seek(0, 2):
+                return cls.from_buffer(b"")
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return cls.from_buffer(data)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Build a grid from a list of rows.
+        :param rows: Rows as strings or lists of 1-character strings.
+        :return: A Grid.
+        """
+        return cls.from_buffer("\n".join("".join(row) for row in rows).encode())
+
+    def index(self, r, c):
+        """
+        Convert a (row, column) position into a flat index.
+        """
+        return self.origin + r * self.stride + c
+
+    def position(self, index):
+        """
+        Convert a flat index into a (row, column) position.
+        """
+        return divmod(index - self.origin, self.stride)
+
+    def indices(self):
+        """
+        Iterate over the flat index of every in-grid cell in row-major order.
+        """
+        for r in range(self.rows):
+            start = self.origin + r * self.stride
+            yield from range(start, start + self.cols)
+
+    def find(self, char):
+        """
+        Find the first cell holding a character.
+        :param char: The 1-character string to look for.
+        :return: The flat index of the cell, or -1 if it is absent.
+        """
+        return self.cells.find(char.encode())
+
+    def row(self, r):
+        """
+        Get one row of the grid as a string.
+        """
+        start = self.origin + r * self.stride
+        return self.cells[start:start + self.cols].decode()
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, r):
+        if not 0 <= r < self.rows:
+            raise IndexError("Grid row out of range.")
+        return self.row(r)
+
+    def __iter__(self):
+        return (self.row(r) for r in range(self.rows))